@@ -1,23 +1,177 @@
-import argparse
+import functools
+import os
 import sys
-import shutil
-import pathlib
+import types
 import typing
-from . import main as app_main
+from . import __version__
 
-# Use the modern 'files()' API (has a fallback for Python 3.8, but not used.)
-# except ImportError:
-# Fallback for Python < 3.9 not needed, this only runs with Python 3.10+
-# from importlib_resources import files, as_file
-from importlib.resources import files, as_file
+
+# Config file extensions copied by 'twidgets init' ('.env.example' ends with '.example')
+_CONFIG_SUFFIXES = frozenset(('yaml', 'yml', 'env', 'example', 'txt'))
+
+
+def _iter_config_files(root: str) -> typing.Iterator[os.DirEntry[str]]:
+    """Yield all config files below root, walking the tree once with os.scandir()"""
+    stack: list[str] = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    _, dot, extension = entry.name.rpartition('.')
+                    if dot and extension in _CONFIG_SUFFIXES and entry.is_file():
+                        yield entry
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy src to dst (contents, permissions and times), copying inside the kernel where possible"""
+    import errno
+    import shutil
+    import stat
+
+    copy_file_range = getattr(os, 'copy_file_range', None)  # Linux only
+    if copy_file_range is None:
+        shutil.copy2(src, dst)
+        return
+
+    try:
+        with open(src, 'rb') as source, open(dst, 'wb') as dest:
+            src_stat = os.fstat(source.fileno())
+            remaining = src_stat.st_size
+            while remaining > 0:
+                copied = copy_file_range(source.fileno(), dest.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+            raise
+        remaining = -1  # Not supported here (e.g. across file systems), use the regular copy
+
+    if remaining != 0:
+        shutil.copy2(src, dst)
+        return
+
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _try_copy(task: tuple[str, str]) -> OSError | None:
+    """Run _fast_copy() for a (source, destination) pair, returning the error instead of raising it"""
+    try:
+        _fast_copy(*task)
+    except OSError as e:
+        return e
+    return None
+
+
+def _copy_config_files(source_config_path: str, dest_config_dir: str, force: bool, verbose: bool) -> bool:
+    """Copy the packaged config files to dest_config_dir, returns False if none were found"""
+    print(f'Copying config files to {dest_config_dir}...')
+
+    # Iterate ONCE to find all relevant files
+    files_to_copy = list(_iter_config_files(source_config_path))
+
+    if not files_to_copy:
+        print('Warning: No config files (.yaml, .yml, .env, .env.example, .example, .txt) found in the package.',
+              file=sys.stderr)
+        return False
+
+    # Every walked path starts with the source directory, so slicing gives the relative path
+    # (plain strings throughout, so the loops below don't build Path objects)
+    source_prefix_len = len(os.path.join(source_config_path, ''))
+    copy_plan: list[tuple[str, str, str]] = []  # (source, relative, destination)
+    for source_file in files_to_copy:
+        # Recreate the relative path in the destination
+        relative_path = source_file.path[source_prefix_len:]
+
+        # rename .env.example -> .env (only the filename changes, it is at the end of the path)
+        if source_file.name.endswith('.env.example'):
+            relative_path = relative_path[:-len('.example')]
+
+        copy_plan.append((source_file.path, relative_path, os.path.join(dest_config_dir, relative_path)))
+
+    # One scan of the destination instead of a stat() per file
+    existing: set[str] = set()
+    if not force:
+        dest_prefix_len = len(os.path.join(dest_config_dir, ''))
+        existing = {entry.path[dest_prefix_len:] for entry in _iter_config_files(dest_config_dir)}
+        # If every file is already there, there is nothing to do
+        # (a subset check, the user may have extra files like todo_save_file.txt)
+        if all(relative_path in existing for _, relative_path, _ in copy_plan):
+            print('Config already initialized (use --force to overwrite)')
+            return True
+
+    # Ensure the parent directories exist in the destination (once per directory)
+    created_dirs: set[str] = {dest_config_dir}
+    for _, _, dest_file in copy_plan:
+        parent = os.path.dirname(dest_file)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
+
+    # Check for --force flag
+    # (the snapshot only holds regular config files; lexists() keeps e.g. a directory
+    # or dangling symlink in the way from being overwritten, without a Path object)
+    to_copy: list[tuple[str, str]] = [
+        (source_file, dest_file)
+        for source_file, relative_path, dest_file in copy_plan
+        if force or (relative_path not in existing and not os.path.lexists(dest_file))
+    ]
+
+    # The copies are I/O bound (the GIL is released during the syscalls), so overlap them
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+        copy_errors: dict[str, OSError | None] = dict(
+            zip((dest_file for _, dest_file in to_copy), executor.map(_try_copy, to_copy))
+        )
+
+    # One summary line; the per-file log (--verbose) is collected and written once,
+    # in the same order as the copy plan (errors always go to stderr)
+    copied = skipped = errored = 0
+    log_lines: list[str] = []
+    for _, relative_path, dest_file in copy_plan:
+        if dest_file not in copy_errors:
+            skipped += 1
+            if verbose:
+                log_lines.append(f'  Skipped (exists): {relative_path}')
+        elif (error := copy_errors[dest_file]) is not None:
+            errored += 1
+            print(f'  Error copying {relative_path}: {error}', file=sys.stderr)
+        else:
+            copied += 1
+            if verbose:
+                log_lines.append(f'  Copied: {relative_path}')
+
+    log_lines.append(f'Copied {copied}, skipped {skipped}, errored {errored} -> {dest_config_dir}')
+    sys.stdout.write('\n'.join(log_lines) + '\n')
+
+    return True
+
+
+@functools.cache
+def _config_traversable() -> typing.Any:
+    """Return the packaged config directory (resolved once, then cached)"""
+    # Use the modern 'files()' API (has a fallback for Python 3.8, but not used.)
+    # except ImportError:
+    # Fallback for Python < 3.9 not needed, this only runs with Python 3.10+
+    # from importlib_resources import files
+    from importlib.resources import files
+
+    # 'twidgets.config' maps to the 'twidgets/config/' directory
+    return files('twidgets.config')
 
 
 def init_command(args: typing.Any) -> None:
     """Handles the 'twidgets init' subcommand."""
 
+    # Only needed here, so other commands don't pay for these imports
+    import pathlib
+    from importlib.resources import as_file
+
     try:
-        # 'twidgets.config' maps to the 'twidgets/config/' directory
-        source_config_dir_traversable = files('twidgets.config')
+        source_config_dir_traversable = _config_traversable()
     except ModuleNotFoundError:
         print('Error: Could not find the package config files. Is \'twidgets\' installed correctly?', file=sys.stderr)
         sys.exit(1)
@@ -33,85 +187,95 @@ def init_command(args: typing.Any) -> None:
         sys.exit(1)
 
     # --- Improved File Copying Logic ---
-    with as_file(source_config_dir_traversable) as source_config_path:
-
-        print(f'Copying config files to {dest_config_dir}...')
-
-        # Define allowed extensions
-        allowed_extensions = {'.yaml', '.yml', '.env', '.env.example', '.example', '.txt'}
-
-        # Iterate ONCE to find all relevant files
-        files_to_copy = [
-            f for f in source_config_path.rglob('*')
-            if f.suffix in allowed_extensions and f.is_file()
-        ]
-
-        if not files_to_copy:
-            print('Warning: No config files (.yaml, .yml, .env, .env.example, .example, .txt) found in the package.',
-                  file=sys.stderr)
-            return
-
-        for source_file in files_to_copy:
-            # Recreate the relative path in the destination
-            relative_path = source_file.relative_to(source_config_path)
-
-            # rename .env.example -> .env
-            if source_file.name.endswith('.env.example'):
-                # Replace only the filename, keep the directory
-                relative_path = relative_path.with_name(
-                    relative_path.name[:-len('.example')]
-                )
-
-            dest_file = dest_config_dir / relative_path
-
-            # Ensure the file's parent directory exists in the destination
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Check for --force flag
-            if not dest_file.exists() or args.force:
-                try:
-                    shutil.copy2(source_file, dest_file)
-                    print(f'  Copied: {relative_path}')
-                except OSError as e:
-                    print(f'  Error copying {relative_path}: {e}', file=sys.stderr)
-            else:
-                print(f'  Skipped (exists): {relative_path}')
+    if hasattr(source_config_dir_traversable, '__fspath__'):
+        # Installed on disk (the usual case): the files are already there, no temporary copy needed
+        copied = _copy_config_files(
+            os.fspath(source_config_dir_traversable), str(dest_config_dir), args.force, args.verbose
+        )
+    else:
+        # E.g. installed inside a zip file
+        with as_file(source_config_dir_traversable) as source_config_path:
+            copied = _copy_config_files(str(source_config_path), str(dest_config_dir), args.force, args.verbose)
+
+    if not copied:
+        return
 
     print('\nInitialization complete.')
     print(f'Your configuration files are in: {dest_config_dir}')
 
 
+_USAGE = 'usage: twidgets [-h] [-v] {init} ...\n'
+
+_HELP = _USAGE + """\
+
+Terminal Widgets main command
+
+positional arguments:
+  {init}         Available commands
+    init         Initialize user configuration files
+
+options:
+  -h, --help     show this help message and exit
+  -v, --version  show program's version number and exit
+"""
+
+_INIT_USAGE = 'usage: twidgets init [-h] [-f] [--verbose]\n'
+
+_INIT_HELP = _INIT_USAGE + """\
+
+options:
+  -h, --help   show this help message and exit
+  -f, --force  Overwrite existing configuration files
+  --verbose    List every copied and skipped file
+"""
+
+
+def _usage_error(usage: str, message: str) -> typing.NoReturn:
+    """Print the usage and an error message to stderr and exit with status 2"""
+    sys.stderr.write(f'{usage}twidgets: error: {message}\n')
+    sys.exit(2)
+
+
 def main() -> None:
     """Main entry point for the 'twidgets' command."""
 
-    # Adding prog='twidgets' improves the help message
-    parser = argparse.ArgumentParser(
-        description='Terminal Widgets main command',
-        prog='twidgets'
-    )
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # 'init' subcommand
-    init_parser = subparsers.add_parser('init', help='Initialize user configuration files')
-    init_parser.add_argument(
-        '-f', '--force',
-        action='store_true',
-        help='Overwrite existing configuration files'
-    )
-    init_parser.set_defaults(func=init_command)
-
-    args = parser.parse_args()
-
-    if hasattr(args, 'func'):
-        # A subcommand was called (e.g., 'init')
-        args.func(args)
-    else:
+    # A single subcommand and a few flags: parsed by hand, so startup doesn't pay for argparse
+    argv = sys.argv[1:]
+
+    if not argv:
         # No subcommand given, run the main application
+        # (imported here, so 'init' and '--help' don't load the whole app)
+        from . import main as app_main
+
         try:
             app_main.main_entry_point()
         except KeyboardInterrupt:
             print('\nExiting.')
             sys.exit(0)
+        return
+
+    command = argv[0]
+    if command in ('-h', '--help'):
+        sys.stdout.write(_HELP)
+    elif command in ('-v', '--version'):
+        print(f'twidgets {__version__}')
+    elif command == 'init':
+        force = verbose = False
+        for arg in argv[1:]:
+            if arg in ('-h', '--help'):
+                sys.stdout.write(_INIT_HELP)
+                return
+            if arg in ('-f', '--force'):
+                force = True
+            elif arg == '--verbose':
+                verbose = True
+            else:
+                _usage_error(_USAGE, f'unrecognized arguments: {arg}')
+        init_command(types.SimpleNamespace(force=force, verbose=verbose))
+    elif command.startswith('-'):
+        _usage_error(_USAGE, f'unrecognized arguments: {command}')
+    else:
+        _usage_error(_USAGE, f'argument command: invalid choice: \'{command}\' (choose from \'init\')')
 
 
 if __name__ == '__main__':
@@ -1,32 +1,37 @@
 from __future__ import annotations  # allows forward references in type hints
+from collections import defaultdict
 from enum import Enum, IntEnum
 from pathlib import Path
 import yaml
 import yaml.parser
 import yaml.scanner
-from dotenv import load_dotenv
 import os
 import curses
-import _curses
 import typing
 import threading
+import concurrent.futures
 import time as time_module
 import pkgutil
 import types
+import functools
 import importlib
 import importlib.util
 import sys
 
 
 class Dimensions:
+    __slots__ = ('height', 'width', 'y', 'x', '_formatted')
+
     def __init__(self, height: int, width: int, y: int, x: int) -> None:
         self.height: int = height
         self.width: int = width
         self.y: int = y
         self.x: int = x
+        # Dimensions don't change after construction, so this is built once (used on every (re)init)
+        self._formatted: tuple[int, int, int, int] = (height, width, y, x)
 
-    def formatted(self) -> list[int]:
-        return [self.height, self.width, self.y, self.x]
+    def formatted(self) -> tuple[int, int, int, int]:
+        return self._formatted
 
 
 class Widget:
@@ -38,6 +43,7 @@ class Widget:
     MouseClickUpdateFunction = typing.Callable[['Widget', int, int, int, 'UIState'], None]
     KeyBoardUpdateFunction = typing.Callable[['Widget', int, 'UIState', 'BaseConfig'], None]
     InitializeFunction = typing.Callable[['Widget', 'UIState', 'BaseConfig'], None]
+    TeardownFunction = typing.Callable[['Widget'], None]
 
     def __init__(
             self,
@@ -51,7 +57,8 @@ class Widget:
             update_func: UpdateFunction | None,
             mouse_click_func: MouseClickUpdateFunction | None,
             keyboard_func: KeyBoardUpdateFunction | None,
-            init_func: InitializeFunction | None
+            init_func: InitializeFunction | None,
+            teardown_func: TeardownFunction | None = None
     ) -> None:
         self.name = name
         self.title = title
@@ -62,6 +69,7 @@ class Widget:
         self._keyboard_func = keyboard_func
         self._draw_func = draw_func
         self._init_func = init_func
+        self._teardown_func = teardown_func
         self.last_updated: int | float | None = 0
         self.dimensions = dimensions
         try:
@@ -73,24 +81,72 @@ class Widget:
 
         self.lock: threading.Lock = threading.Lock()
 
+        self._enabled: bool = bool(config.enabled)  # Read once (config changes rebuild all widgets on restart)
+
+        # Chosen once here, so the main loop doesn't have to branch on every frame
+        self.refresh: typing.Callable[[UIState, BaseConfig], None] = (
+            self._refresh_default if self.updatable() else self._refresh_direct
+        )
+        self._last_drawn: tuple[typing.Any, bool] | None = None  # (draw_data, highlighted) of the last draw
+
+    def _refresh_direct(self, ui_state: UIState, base_config: BaseConfig) -> None:
+        """Draw widgets without an update function"""
+        self.draw(ui_state, base_config)
+
+    def _refresh_default(self, ui_state: UIState, base_config: BaseConfig) -> None:
+        """Draw widgets from the data provided by their update function"""
+        # Pinned by reference: updates replace draw_data with a new object instead of changing it,
+        # and reading the attribute once is atomic, so no lock or copy is needed
+        draw_data = self.draw_data
+        if not draw_data:
+            return  # Data still loading
+
+        if '__error__' in draw_data:
+            display_error(self, [draw_data['__error__']], ui_state, base_config)
+        else:
+            self.draw(ui_state, base_config, draw_data)
+
+    def _refresh_on_change(self, ui_state: UIState, base_config: BaseConfig) -> None:
+        """Like _refresh_default, but keeps the window as is while data and highlight are unchanged"""
+        highlighted: bool = self is ui_state.highlighted
+        if (
+                self._last_drawn is not None
+                and self._last_drawn[0] is self.draw_data
+                and self._last_drawn[1] == highlighted
+        ):
+            return
+
+        draw_data = self.draw_data
+        self._refresh_default(ui_state, base_config)
+        self._last_drawn = (draw_data, highlighted)
+
+    def redraw_on_change_only(self) -> None:
+        """Only redraw when the update function returned new data (or the highlight changed)"""
+        if self.updatable():
+            self.refresh = self._refresh_on_change
+
     def noutrefresh(self) -> None:
         self.win.noutrefresh()
 
     def init(self, ui_state: UIState, base_config: BaseConfig, *args: typing.Any, **kwargs: typing.Any) -> None:
-        if self._init_func and self.config.enabled:
+        if self._init_func and self._enabled:
             self._init_func(self, ui_state, base_config, *args, **kwargs)
 
+    def teardown(self) -> None:
+        if self._teardown_func and self._enabled:
+            self._teardown_func(self)
+
     def draw(self, ui_state: UIState, base_config: BaseConfig, *args: typing.Any, **kwargs: typing.Any) -> None:
-        if self.config.enabled:
+        if self._enabled:
             self._draw_func(self, ui_state, base_config, *args, **kwargs)
 
     def update(self, config_loader: ConfigLoader) -> list[str] | None:
-        if self._update_func and self.config.enabled:
+        if self._update_func and self._enabled:
             return self._update_func(self, config_loader)
         return None
 
     def updatable(self) -> bool:
-        if self._update_func and self.interval and self.config.enabled:
+        if self._update_func and self.interval and self._enabled:
             return True
         return False
 
@@ -104,12 +160,18 @@ class Widget:
 
     def reinit_window(self, stdscr: CursesWindowType) -> None:
         self.win = stdscr.subwin(*self.dimensions.formatted())
+        self._last_drawn = None
 
 
 class UIState:
+    __slots__ = ('previously_highlighted', 'highlighted', 'widget_bboxes')
+
     def __init__(self) -> None:
         self.previously_highlighted: Widget | None = None
         self.highlighted: Widget | None = None
+        # (y1, y2, x1, x2, widget) for mouse hit-testing, built on the first click
+        # (widget dimensions are fixed; widgets are only rebuilt on restart, with a new UIState)
+        self.widget_bboxes: tuple[tuple[int, int, int, int, Widget], ...] | None = None
 
 
 class RestartException(Exception):
@@ -139,12 +201,13 @@ class TerminalTooSmall(Exception):
         return self.__str__()
 
     def __str__(self) -> str:
-        return \
-            f'\n' \
-            f'⚠️ Terminal too small. Minimum size: {self.min_width}x{self.min_height}\n' \
-            f'(Width x Height)\n' \
-            f'Current size: {self.width}x{self.height}\n' \
-            f'Either decrease your font size, increase the size of the terminal, or remove widgets.\n'
+        return (
+            '\n'
+            f'⚠️ Terminal too small. Minimum size: {self.min_width}x{self.min_height}\n'
+            '(Width x Height)\n'
+            f'Current size: {self.width}x{self.height}\n'
+            'Either decrease your font size, increase the size of the terminal, or remove widgets.\n'
+        )
 
 
 class ConfigScanFoundError(Exception):
@@ -196,13 +259,15 @@ class LogLevels(Enum):
     @classmethod
     def from_key(cls, key: int) -> LogLevels:
         """Return the LogLevels member that matches the key"""
-        for level in cls:
-            if level.key == key:
-                return level
-        return LogLevels.UNKNOWN
+        return _LOG_LEVELS_BY_KEY.get(key, LogLevels.UNKNOWN)
+
+
+_LOG_LEVELS_BY_KEY: dict[int, LogLevels] = {level.key: level for level in LogLevels}
 
 
 class LogMessage:
+    __slots__ = ('message', 'level')
+
     def __init__(self, message: str, level: int) -> None:
         self.message: str = message
         self.level: int = level
@@ -227,9 +292,11 @@ class LogMessages:
             self.log_messages = log_messages
 
     def __add__(self, other: LogMessages) -> LogMessages:
-        new_log: LogMessages = LogMessages()
-        new_log.log_messages = self.log_messages + other.log_messages
-        return new_log
+        return LogMessages(self.log_messages + other.log_messages)
+
+    def __iadd__(self, other: LogMessages) -> LogMessages:
+        self.log_messages.extend(other.log_messages)
+        return self
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, LogMessages):
@@ -244,34 +311,26 @@ class LogMessages:
     def add_log_message(self, message: LogMessage) -> None:
         self.log_messages.append(message)
 
-    def print_log_messages(self, heading: str) -> None:
+    def print_log_messages(self, heading: str, file: typing.TextIO | None = None) -> None:
         if not self.log_messages:
             return
 
-        print(heading, end='')
-        log_messages_by_level: dict[int, list[LogMessage]] = {}
+        print(heading, end='', file=file)
+        log_messages_by_level: defaultdict[int, list[LogMessage]] = defaultdict(list)
         for message in self.log_messages:
-            if message.level in log_messages_by_level.keys():
-                log_messages_by_level[message.level].append(message)
-            else:
-                log_messages_by_level[message.level] = [message]
+            log_messages_by_level[message.level].append(message)
 
-        for level in sorted(log_messages_by_level.keys()):
-            if log_messages_by_level[level]:
-                print(f'\n{LogLevels.from_key(level).label}:')
-                for message in log_messages_by_level[level]:
-                    print(message)
+        for level in sorted(log_messages_by_level):
+            print(f'\n{LogLevels.from_key(level).label}:', file=file)
+            for message in log_messages_by_level[level]:
+                print(message, file=file)
 
     def contains_error(self) -> bool:
-        for message in self.log_messages:
-            if message.is_error():
-                return True
-        return False
+        error_key: int = LogLevels.ERROR.key
+        return any(message.level == error_key for message in self.log_messages)
 
     def is_empty(self) -> bool:
-        if self.log_messages:
-            return False
-        return True
+        return not self.log_messages
 
 
 class Config:
@@ -324,17 +383,21 @@ class Config:
 
 
 class RGBColor:
+    __slots__ = ('r', 'g', 'b', '_scaled')
+
     def __init__(self, r: int, g: int, b: int) -> None:
         self.r = r
         self.g = g
         self.b = b
+        # curses (0-1000) scale, computed once: colors don't change after construction
+        self._scaled: tuple[int, int, int] = (
+            round(r * 1000 / 255),
+            round(g * 1000 / 255),
+            round(b * 1000 / 255),
+        )
 
     def rgb_to_0_1000(self) -> tuple[int, int, int]:
-        return (
-            round(self.r * 1000 / 255),
-            round(self.g * 1000 / 255),
-            round(self.b * 1000 / 255),
-        )
+        return self._scaled
 
     @staticmethod
     def add_rgb_color_from_dict(color: dict[str, int]) -> RGBColor:
@@ -375,6 +438,52 @@ class BaseStandardFallBackConfig:
         self.help_key: str = 'h'
 
 
+def _log_missing_base_config(name: str, log_messages: LogMessages) -> None:
+    log_messages.add_log_message(LogMessage(
+        f'Configuration for {name} is missing (base.yaml,'
+        f' falling back to standard config)',
+        LogLevels.WARNING.key
+    ))
+
+
+def _validate_color(name: str, value: dict[str, int] | None, log_messages: LogMessages) -> RGBColor | None:
+    """Return the configured color, or None (and log why) if the fallback has to be used"""
+    if value is None:
+        _log_missing_base_config(name, log_messages)
+        return None
+    try:
+        return RGBColor.add_rgb_color_from_dict(value)
+    except KeyError as e:
+        log_messages.add_log_message(LogMessage(
+            f'Configuration for {name} is missing for {e}',
+            LogLevels.ERROR.key
+        ))
+    except ValueError as e:
+        log_messages.add_log_message(LogMessage(
+            f'Configuration for {name} is invalid for {e}',
+            LogLevels.ERROR.key
+        ))
+    return None
+
+
+def _validate_single_char_key(name: str, value: str | None, log_messages: LogMessages) -> bool:
+    """Log problems with a configured key, returns False if it is missing (fallback has to be used)"""
+    if value is None:
+        _log_missing_base_config(name, log_messages)
+        return False
+    if len(value) != 1:
+        log_messages.add_log_message(LogMessage(
+            f'Configuration for {name} value wrong length (not 1)',
+            LogLevels.ERROR.key
+        ))
+    if not (value.isalpha() or value.isdigit()):
+        log_messages.add_log_message(LogMessage(
+            f'Configuration for {name} value not alphabetic or numeric',
+            LogLevels.ERROR.key
+        ))
+    return True
+
+
 class BaseConfig:
     def __init__(
             self,
@@ -404,124 +513,16 @@ class BaseConfig:
         self.reload_key: str = base_standard_fallback_config.reload_key
         self.help_key: str = base_standard_fallback_config.help_key
 
-        if background_color is not None:
-            try:
-                self.background_color = RGBColor.add_rgb_color_from_dict(background_color)
-            except KeyError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for background_color is missing for {e}',
-                    LogLevels.ERROR.key
-                ))
-            except ValueError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for background_color is invalid for {e}', LogLevels
-                    .ERROR.key))
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for background_color is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if foreground_color is not None:
-            try:
-                self.foreground_color = RGBColor.add_rgb_color_from_dict(foreground_color)
-            except KeyError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for foreground_color is missing for {e}',
-                    LogLevels.ERROR.key
-                ))
-            except ValueError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for foreground_color is invalid for {e}',
-                    LogLevels.ERROR.key
-                ))
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for foreground_color is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if primary_color is not None:
-            try:
-                self.primary_color = RGBColor.add_rgb_color_from_dict(primary_color)
-            except KeyError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for primary_color is missing for {e}',
-                    LogLevels.ERROR.key
-                ))
-            except ValueError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for error_color is invalid for {e}',
-                    LogLevels.ERROR.key
-                ))
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for primary_color is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if secondary_color is not None:
-            try:
-                self.secondary_color = RGBColor.add_rgb_color_from_dict(secondary_color)
-            except KeyError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for secondary_color is missing for {e}',
-                    LogLevels.ERROR.key
-                ))
-            except ValueError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for error_color is invalid for {e}',
-                    LogLevels.ERROR.key
-                ))
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for secondary_color is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if loading_color is not None:
-            try:
-                self.loading_color = RGBColor.add_rgb_color_from_dict(loading_color)
-            except KeyError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for loading_color is missing for {e}',
-                    LogLevels.ERROR.key
-                ))
-            except ValueError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for error_color is invalid for {e}',
-                    LogLevels.ERROR.key
-                ))
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for loading_color is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if error_color is not None:
-            try:
-                self.error_color = RGBColor.add_rgb_color_from_dict(error_color)
-            except KeyError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for error_color is missing for {e}',
-                    LogLevels.ERROR.key
-                ))
-            except ValueError as e:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for error_color is invalid for {e}',
-                    LogLevels.ERROR.key
-                ))
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for error_color is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
+        for color_name, color_value in (
+                ('background_color', background_color),
+                ('foreground_color', foreground_color),
+                ('primary_color', primary_color),
+                ('secondary_color', secondary_color),
+                ('loading_color', loading_color),
+                ('error_color', error_color),
+        ):
+            if (color := _validate_color(color_name, color_value, log_messages)) is not None:
+                setattr(self, color_name, color)
 
         self.base_colors: dict[int, tuple[int, RGBColor | int]] = {
             2: (1, self.foreground_color),
@@ -539,11 +540,7 @@ class BaseConfig:
                 ))
             self.use_standard_terminal_background = use_standard_terminal_background
         else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for use_standard_terminal_background is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
+            _log_missing_base_config('use_standard_terminal_background', log_messages)
 
         if self.use_standard_terminal_background:
             self.BACKGROUND_NUMBER: int = -1
@@ -556,62 +553,23 @@ class BaseConfig:
         self.LOADING_PAIR_NUMBER: int = 4
         self.ERROR_PAIR_NUMBER: int = 5
 
-        if quit_key is not None:
-            if len(quit_key) != 1:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for quit_key value wrong length (not 1)',
-                    LogLevels.ERROR.key
-                ))
-            if not (quit_key.isalpha() or quit_key.isdigit()):
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for quit_key value not alphabetic or numeric',
-                    LogLevels.ERROR.key
-                ))
-            self.quit_key = quit_key
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for quit_key is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if reload_key is not None:
-            if len(reload_key) != 1:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for reload_key value wrong length (not 1)',
-                    LogLevels.ERROR.key
-                ))
-            if not (reload_key.isalpha() or reload_key.isdigit()):
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for reload_key value not alphabetic or numeric',
-                    LogLevels.ERROR.key
-                ))
-            self.reload_key = reload_key
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for reload_key is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
-
-        if help_key is not None:
-            if len(help_key) != 1:
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for help_key value wrong length (not 1)',
-                    LogLevels.ERROR.key
-                ))
-            if not (help_key.isalpha() or help_key.isdigit()):
-                log_messages.add_log_message(LogMessage(
-                    f'Configuration for help_key value not alphabetic or numeric',
-                    LogLevels.ERROR.key
-                ))
-            self.help_key = help_key
-        else:
-            log_messages.add_log_message(LogMessage(
-                f'Configuration for help_key is missing (base.yaml,'
-                f' falling back to standard config)',
-                LogLevels.WARNING.key
-            ))
+        for key_name, key_value in (
+                ('quit_key', quit_key),
+                ('reload_key', reload_key),
+                ('help_key', help_key),
+        ):
+            if _validate_single_char_key(key_name, key_value, log_messages):
+                setattr(self, key_name, key_value)
+
+        # Keys handled while no widget is highlighted (first one wins if keys are the same)
+        self.global_key_handlers: dict[int, typing.Callable[[LogMessages], None]] = {}
+        for key, handler in (
+                (self.quit_key, _quit_key_handler),
+                (self.help_key, _help_key_handler),
+                (self.reload_key, _reload_key_handler),
+        ):
+            if len(key) == 1:
+                self.global_key_handlers.setdefault(ord(key), handler)
 
         for key, value in kwargs.items():
             log_messages.add_log_message(LogMessage(
@@ -621,9 +579,10 @@ class BaseConfig:
 
 
 def draw_colored_border(win: CursesWindowType, color_pair: int) -> None:
-    win.attron(curses.color_pair(color_pair))
+    attr = convert_color_number_to_curses_pair(color_pair)
+    win.attron(attr)
     win.border()
-    win.attroff(curses.color_pair(color_pair))
+    win.attroff(attr)
 
 
 def draw_widget(
@@ -634,66 +593,105 @@ def draw_widget(
         loading: bool = False,
         error: bool = False
 ) -> None:
-    if not title:
-        title = widget.title[:widget.dimensions.width - 4]
-    else:
-        title = title[:widget.dimensions.width - 4]
-    widget.win.erase()  # Instead of clear(), prevents flickering
-    if widget == ui_state.highlighted:
-        draw_colored_border(widget.win, base_config.PRIMARY_PAIR_NUMBER)
+    win = widget.win
+    win.erase()  # Instead of clear(), prevents flickering
+
+    if widget is ui_state.highlighted:
+        pair_number: int = base_config.PRIMARY_PAIR_NUMBER
     elif loading:
-        draw_colored_border(widget.win, base_config.LOADING_PAIR_NUMBER)
+        pair_number = base_config.LOADING_PAIR_NUMBER
     elif error:
-        draw_colored_border(widget.win, base_config.ERROR_PAIR_NUMBER)
+        pair_number = base_config.ERROR_PAIR_NUMBER
+    else:
+        pair_number = 0  # Standard border
+
+    if pair_number:
+        attr = convert_color_number_to_curses_pair(pair_number)
+        win.attron(attr)
+        win.border()
+        win.attroff(attr)
     else:
-        widget.win.border()
-    widget.win.addstr(0, 2, f'{title}')
+        win.border()
+    win.addstr(0, 2, (title or widget.title)[:widget.dimensions.width - 4])
 
 
 def add_widget_content(widget: Widget, content: list[str]) -> None:
-    for i, line in enumerate(content):
-        if i < widget.dimensions.height - 2:  # Keep inside border
-            widget.win.addstr(1 + i, 1, line[:widget.dimensions.width - 2])
+    # Only the lines that fit inside the border are visited (no per-line bounds check).
+    # Unchanged lines are still written: draw_widget() erased the window, and curses'
+    # own refresh only sends changed cells to the terminal anyway.
+    addstr = widget.win.addstr
+    inner_width: int = widget.dimensions.width - 2
+    for i, line in enumerate(content[:max(0, widget.dimensions.height - 2)], start=1):
+        addstr(i, 1, line[:inner_width])
+
+
+# curses.color_pair() results by pair number (a small fixed set, looked up on every draw)
+_PAIR_CACHE: dict[int, int] = {}
 
 
 def convert_color_number_to_curses_pair(color_number: int) -> int:
-    return curses.color_pair(color_number)
+    attr = _PAIR_CACHE.get(color_number)
+    if attr is None:
+        attr = _PAIR_CACHE[color_number] = curses.color_pair(color_number)
+    return attr
 
 
 def safe_addstr(widget: Widget, y: int, x: int, text: str, color: int = 0) -> None:
-    max_y, max_x = widget.win.getmaxyx()
-    if y < 0 or y >= max_y:
+    # The window is created from widget.dimensions (subwin), so no getmaxyx() call is needed
+    dimensions = widget.dimensions
+    if y < 0 or y >= dimensions.height:
         return
-    safe_text = text[:max_x - x - 1]
     try:
-        widget.win.addstr(y, x, safe_text, color)
+        widget.win.addstr(y, x, text[:dimensions.width - x - 1], color)
     except curses.error:
         pass
 
 
-def loading_screen(widgets: list[Widget], ui_state: UIState, base_config: BaseConfig) -> None:
+def loading_screen(widgets: typing.Sequence[Widget], ui_state: UIState, base_config: BaseConfig) -> None:
+    """Draw the loading state of the given (enabled) widgets"""
     for widget in widgets:
-        if not widget.config.enabled:
-            continue
         draw_widget(widget, ui_state, base_config, loading=True)
         add_widget_content(widget, [' Loading... '])
-        widget.win.refresh()
+        widget.noutrefresh()
+    update_screen()  # One terminal update for all widgets
     return None
 
 
-def initialize_widgets(widget: list[Widget], ui_state: UIState, base_config: BaseConfig) -> None:
+def initialize_widgets(widget: typing.Sequence[Widget], ui_state: UIState, base_config: BaseConfig) -> None:
+    """Run the init function of the given (enabled) widgets"""
     for widget in widget:
-        if not widget.config.enabled:
-            continue
         widget.init(ui_state, base_config)
     return None
 
 
+def teardown_widgets(widgets: typing.Sequence[Widget], log_messages: LogMessages) -> None:
+    """Run the teardown function of the given (enabled) widgets, e.g. to save pending changes before exiting"""
+    # Runs while the app exits (maybe because of another exception), so errors are collected instead of raised
+    # and printed once curses is shut down (see main_entry_point())
+    for widget in widgets:
+        try:
+            widget.teardown()
+        except ConfigSpecificException as e:
+            log_messages += e.log_messages
+        except Exception as e:
+            log_messages.add_log_message(LogMessage(
+                f'Could not close "{widget.name}" widget, unsaved changes may be lost: {e}', LogLevels.ERROR.key
+            ))
+    return None
+
+
 def display_error(widget: Widget, content: list[str], ui_state: UIState, base_config: BaseConfig) -> None:
     draw_widget(widget, ui_state, base_config, ' Error ', error=True)
     add_widget_content(widget, content)
 
 
+# (pair number, xterm color number) for the gradient pairs, starting after the 5 base pairs
+_GRADIENT_PAIRS: tuple[tuple[int, int], ...] = tuple(enumerate((
+    28, 34, 40, 46, 82, 118, 154, 172,
+    196, 160, 127, 135, 141, 99, 63, 33, 27, 24
+), start=6))
+
+
 def init_colors(base_config: BaseConfig) -> None:
     curses.start_color()
     if base_config.use_standard_terminal_background:
@@ -719,20 +717,18 @@ def init_colors(base_config: BaseConfig) -> None:
             10: (5, curses.COLOR_RED)
         }
 
+    init_pair = curses.init_pair
+    background_number: int = base_config.BACKGROUND_NUMBER
+
     for color_number, color in base_config.base_colors.items():
-        curses.init_pair(
+        init_pair(
             color[0],
             color_number,
-            base_config.BACKGROUND_NUMBER
+            background_number
         )
 
-    gradient_color: list[int] = [
-        28, 34, 40, 46, 82, 118, 154, 172,
-        196, 160, 127, 135, 141, 99, 63, 33, 27, 24
-    ]
-
-    for i, color in enumerate(gradient_color, start=6):  # type: ignore
-        curses.init_pair(i, color, base_config.BACKGROUND_NUMBER)  # type: ignore[arg-type]
+    for pair_number, gradient_color in _GRADIENT_PAIRS:
+        init_pair(pair_number, gradient_color, background_number)
 
 
 def init_curses_setup(stdscr: CursesWindowType, base_config: BaseConfig) -> None:
@@ -767,6 +763,9 @@ def validate_terminal_size(stdscr: CursesWindowType, min_height: int, min_width:
         raise TerminalTooSmall(height, width, min_height, min_width)
 
 
+_PROMPT_BACKSPACE_KEYS: frozenset[str | int] = frozenset(('\b', '\x7f', curses.KEY_BACKSPACE))
+
+
 def prompt_user_input(widget: Widget, prompt: str) -> str:
     if not widget.win:
         return ''
@@ -788,18 +787,31 @@ def prompt_user_input(widget: Widget, prompt: str) -> str:
     input_x: int = left_margin + len(prompt)
     max_input_len: int = max(0, usable_width - len(prompt) - 1)
 
-    input_str: str = ''
+    input_chars: list[str] = []  # Edited in place, joined only for display / the result
     cursor_pos: int = 0
 
+    move = win.move
+    addstr = win.addstr
+    blank_line: str = ' ' * usable_width
+
     def redraw_input() -> None:
-        win.move(input_y, left_margin)
+        move(input_y, left_margin)
         # Clear only the safe inner region (never touch border)
-        win.addstr(' ' * usable_width)
-        win.move(input_y, left_margin)
-        win.addstr(prompt)
-        visible_text = input_str[:max_input_len]
-        win.addstr(visible_text)
-        win.move(input_y, input_x + cursor_pos)
+        addstr(blank_line)
+        move(input_y, left_margin)
+        addstr(prompt)
+        visible_text = ''.join(input_chars[:max_input_len])
+        addstr(visible_text)
+        move(input_y, input_x + cursor_pos)
+        win.refresh()
+
+    def redraw_tail(start: int, shortened: bool) -> None:
+        """Redraw only the text from start on (plus a blank to clear the old last char, if shortened)"""
+        move(input_y, input_x + start)
+        addstr(''.join(input_chars[start:max_input_len]))
+        if shortened:
+            addstr(' ')
+        move(input_y, input_x + cursor_pos)
         win.refresh()
 
     try:
@@ -813,14 +825,14 @@ def prompt_user_input(widget: Widget, prompt: str) -> str:
         if ch == '\n':  # ENTER
             break
         if ch == '\x1b' or ch == CursesKeys.ESCAPE:
-            input_str = ''  # Return empty string
+            input_chars.clear()  # Return empty string
             break
-        elif ch in ('\b', '\x7f', curses.KEY_BACKSPACE):  # BACKSPACE
+        elif ch in _PROMPT_BACKSPACE_KEYS:  # BACKSPACE
             if cursor_pos > 0:
-                input_str = input_str[:cursor_pos - 1] + input_str[cursor_pos:]
                 cursor_pos -= 1
+                del input_chars[cursor_pos]
                 try:
-                    redraw_input()
+                    redraw_tail(cursor_pos, shortened=True)
                 except curses.error:
                     return ''
         elif ch == curses.KEY_LEFT:  # LEFT
@@ -829,30 +841,58 @@ def prompt_user_input(widget: Widget, prompt: str) -> str:
                 win.move(input_y, input_x + cursor_pos)
                 win.refresh()
         elif ch == curses.KEY_RIGHT:  # RIGHT
-            if cursor_pos < len(input_str):
+            if cursor_pos < len(input_chars):
                 cursor_pos += 1
                 win.move(input_y, input_x + cursor_pos)
                 win.refresh()
         elif ch == curses.KEY_DC:  # DELETE
-            if cursor_pos < len(input_str):
-                input_str = input_str[:cursor_pos] + input_str[cursor_pos + 1:]
+            if cursor_pos < len(input_chars):
+                del input_chars[cursor_pos]
                 try:
-                    redraw_input()
+                    redraw_tail(cursor_pos, shortened=True)
                 except curses.error:
                     return ''
         elif isinstance(ch, int):  # Ignore other special keys
             continue
         elif isinstance(ch, str) and len(ch) == 1:  # Normal text input
-            if len(input_str) < max_input_len:
-                input_str = input_str[:cursor_pos] + ch + input_str[cursor_pos:]
+            if len(input_chars) < max_input_len:
+                input_chars.insert(cursor_pos, ch)
                 cursor_pos += 1
                 try:
-                    redraw_input()
+                    redraw_tail(cursor_pos - 1, shortened=False)
                 except curses.error:
                     return ''
 
     curses.curs_set(0)
-    return input_str
+    return ''.join(input_chars)
+
+
+# Widget modules / files are named <name>_widget(.py), the name is the part before the suffix
+_WIDGET_SUFFIX = '_widget'
+_WIDGET_FILE_SUFFIX = '_widget.py'
+
+# Custom widget files by directory, together with the directory's mtime when it was listed
+# (module level, so restarts reuse it; adding / removing / renaming a file changes the mtime)
+_WIDGET_DIR_CACHE: dict[Path, tuple[int, list[Path]]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_builtin_widget_names(pkg_path: tuple[str, ...]) -> tuple[str, ...]:
+    """Names of the *_widget modules in pkg_path (the package doesn't change while running, so restarts reuse this)"""
+    return tuple(
+        module.name[:-len(_WIDGET_SUFFIX)]
+        for module in pkgutil.iter_modules(pkg_path)
+        # Only care about modules ending in `_widget`
+        if module.name.endswith(_WIDGET_SUFFIX)
+    )
+
+
+def _cached_import(module_name: str) -> types.ModuleType:
+    """Import a module, or return it straight from sys.modules if it was imported before (e.g. on restart)"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
 
 
 class WidgetLoader:
@@ -863,15 +903,7 @@ class WidgetLoader:
     @staticmethod
     def discover_builtin_widgets(widgets_pkg: types.ModuleType) -> list[str]:
         """Discord built-in widgets in twidgets/widgets/*_widget.py"""
-        widget_names: list[str] = []
-
-        for module in pkgutil.iter_modules(widgets_pkg.__path__):
-            # Only care about modules ending in `_widget`
-            if module.name.endswith('_widget'):
-                widget_name: str = module.name.replace('_widget', '')
-                widget_names.append(widget_name)
-
-        return widget_names
+        return list(_discover_builtin_widget_names(tuple(widgets_pkg.__path__)))
 
     @staticmethod
     def load_builtin_widget_modules(widget_names: list[str]) -> dict[str, types.ModuleType]:
@@ -880,42 +912,57 @@ class WidgetLoader:
 
         for name in widget_names:
             module_path = f'twidgets.widgets.{name}_widget'
-            modules[name] = importlib.import_module(module_path)
+            modules[name] = _cached_import(module_path)
 
         return modules
 
     def discover_custom_widgets(self) -> list[str]:
         """Discover user-defined widgets in ~/.config/twidgets/py_widgets/*_widget.py"""
         widget_names: list[str] = []
-        if not self.PER_WIDGET_PY_DIR.exists():
-            return widget_names
 
-        for file in self.PER_WIDGET_PY_DIR.iterdir():
-            if file.is_file() and file.name.endswith('_widget.py'):
-                widget_name = file.stem.replace('_widget', '')
-                widget_names.append(widget_name)
+        for file in self._list_widget_files(self.PER_WIDGET_PY_DIR):
+            widget_name = file.name[:-len(_WIDGET_FILE_SUFFIX)]
+            widget_names.append(widget_name)
 
         return widget_names
 
-    def load_custom_widget_modules(self) -> dict[str, types.ModuleType]:
-        """Load custom widgets dynamically from files"""
+    def load_custom_widget_modules(self, widget_names: list[str] | None = None) -> dict[str, types.ModuleType]:
+        """Load custom widgets dynamically from files (only the ones in widget_names, if given)"""
         modules: dict[str, types.ModuleType] = {}
-        if not self.PER_WIDGET_PY_DIR.exists():
-            return modules
 
-        for file in self.PER_WIDGET_PY_DIR.iterdir():
-            if file.is_file() and file.name.endswith('_widget.py'):
-                widget_name = file.stem.replace('_widget', '')
+        for file in self._list_widget_files(self.PER_WIDGET_PY_DIR):
+            widget_name = file.name[:-len(_WIDGET_FILE_SUFFIX)]
+            if widget_names is not None and widget_name not in widget_names:
+                continue
 
-                spec = importlib.util.spec_from_file_location(widget_name, file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[widget_name] = module
-                    spec.loader.exec_module(module)
-                    modules[widget_name] = module
+            spec = importlib.util.spec_from_file_location(widget_name, file)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[widget_name] = module
+                spec.loader.exec_module(module)
+                modules[widget_name] = module
 
         return modules
 
+    @staticmethod
+    def _list_widget_files(directory: Path) -> list[Path]:
+        """All *_widget.py files in directory (cached until the directory changes)"""
+        try:
+            mtime_ns: int = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        cached = _WIDGET_DIR_CACHE.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with os.scandir(directory) as entries:
+            files: list[Path] = [
+                Path(entry.path) for entry in entries if entry.name.endswith(_WIDGET_FILE_SUFFIX) and entry.is_file()
+            ]
+        _WIDGET_DIR_CACHE[directory] = (mtime_ns, files)
+        return files
+
     @staticmethod
     def build_widgets(
             stdscr: CursesWindowType,
@@ -939,6 +986,23 @@ class WidgetLoader:
         return widgets
 
 
+# libyaml's C parser if PyYAML was built with it, else the pure Python one (much slower)
+_YAML_LOADER: typing.Any = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML by path, validated by the file's (mtime, size) when it was parsed.
+# Kept at module level so it survives restarts (new ConfigLoader per restart).
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], dict[str, typing.Any]]] = {}
+
+
+# (mtime, size) of each secrets.env when reload_secrets() last loaded it (module level, so restarts reuse it)
+_SECRETS_LOADED: dict[Path, tuple[int, int] | None] = {}
+
+
+def invalidate_yaml_cache() -> None:
+    """Forget all parsed config files, so the next loads read them from disk"""
+    _YAML_CACHE.clear()
+
+
 class ConfigLoader:
     def __init__(self) -> None:
         # self.BASE_DIR = Path(__file__).resolve().parent.parent
@@ -946,10 +1010,29 @@ class ConfigLoader:
         # self.WIDGETS_DIR = self.CONFIG_DIR / 'widgets'
         self.CONFIG_DIR = Path.home() / '.config' / 'twidgets'
         self.PER_WIDGET_CONFIG_DIR = self.CONFIG_DIR / 'widgets'
-        load_dotenv(self.CONFIG_DIR / 'secrets.env')
+        self.SECRETS_PATH = self.CONFIG_DIR / 'secrets.env'
+        # Already in os.environ if reload_secrets() loaded this unchanged file before (e.g. on restart)
+        if _SECRETS_LOADED.get(self.SECRETS_PATH) != self._secrets_signature():
+            # Imported here, so importing this module (e.g. for its classes) doesn't load dotenv
+            from dotenv import load_dotenv
+            load_dotenv(self.SECRETS_PATH)
+
+    def _secrets_signature(self) -> tuple[int, int] | None:
+        """(mtime, size) of secrets.env, None if it doesn't exist"""
+        try:
+            stat_result = self.SECRETS_PATH.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
 
     def reload_secrets(self) -> None:
-        load_dotenv(self.CONFIG_DIR / 'secrets.env', override=True)
+        """Load secrets.env into the environment (overriding), unless it is unchanged since the last reload"""
+        signature = self._secrets_signature()
+        if signature is not None and _SECRETS_LOADED.get(self.SECRETS_PATH) == signature:
+            return
+        from dotenv import load_dotenv
+        load_dotenv(self.SECRETS_PATH, override=True)
+        _SECRETS_LOADED[self.SECRETS_PATH] = signature
 
     @staticmethod
     def get_secret(name: str, default: typing.Any | None = None) -> str | None:
@@ -957,29 +1040,49 @@ class ConfigLoader:
 
     @staticmethod
     def load_yaml(path: Path) -> dict[str, typing.Any]:
+        """Parse a YAML file, unchanged files are returned from the cache (raises FileNotFoundError)"""
+        # Callers get a shallow copy: top-level keys may be changed, nested values (lists, dicts) must not be
+        stat_result = path.stat()
+        validator: tuple[int, int] = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[0] == validator:
+            return dict(cached[1])
+
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+                pure_yaml: dict[str, typing.Any] = yaml.load(f, Loader=_YAML_LOADER) or {}
         except yaml.scanner.ScannerError:
             raise YAMLParseException(f'Config for path "{path}" not valid YAML')
 
+        _YAML_CACHE[path] = (validator, pure_yaml)
+        return dict(pure_yaml)  # The cache survives restarts, so callers never get the cached dict itself
+
     def load_base_config(self, log_messages: LogMessages) -> BaseConfig:
         base_path = self.CONFIG_DIR / 'base.yaml'
-        if not base_path.exists():
-            raise ConfigFileNotFoundError(f'Base config "{base_path}" not found')
         try:
             pure_yaml: dict[str, typing.Any] = self.load_yaml(base_path)
+        except FileNotFoundError:
+            raise ConfigFileNotFoundError(f'Base config "{base_path}" not found')
         except yaml.parser.ParserError:
             raise YAMLParseException(f'Base config "{base_path}" not valid YAML')
 
         return BaseConfig(log_messages=log_messages, **pure_yaml)
 
+    def is_widget_enabled(self, widget_name: str) -> bool:
+        """Read 'enabled' from a widget's config (unreadable configs count as enabled, so their errors surface)"""
+        try:
+            pure_yaml: dict[str, typing.Any] = self.load_yaml(self.PER_WIDGET_CONFIG_DIR / f'{widget_name}.yaml')
+        except (OSError, yaml.YAMLError, YAMLParseException):
+            return True
+        return pure_yaml.get('enabled') is not False
+
     def load_widget_config(self, log_messages: LogMessages, widget_name: str) -> Config:
         path = self.PER_WIDGET_CONFIG_DIR / f'{widget_name}.yaml'
-        if not path.exists():
-            raise ConfigFileNotFoundError(f'Config for widget "{widget_name}" not found')
         try:
             pure_yaml: dict[str, typing.Any] = self.load_yaml(path)
+        except FileNotFoundError:
+            raise ConfigFileNotFoundError(f'Config for widget "{widget_name}" not found')
         except yaml.parser.ParserError:
             raise YAMLParseException(f'Config for widget "{widget_name}" not valid YAML')
 
@@ -1024,17 +1127,32 @@ def switch_windows(
         _b_state: int,
         widgets: dict[str, Widget]
 ) -> None:
-    widget_list = list(widgets.values())
+    widget_bboxes = ui_state.widget_bboxes
+    if widget_bboxes is None:
+        # Built from the dict's values view directly (no intermediate list)
+        widget_bboxes = ui_state.widget_bboxes = tuple(
+            (
+                widget.dimensions.y,
+                widget.dimensions.y + widget.dimensions.height,
+                widget.dimensions.x,
+                widget.dimensions.x + widget.dimensions.width,
+                widget
+            )
+            for widget in widgets.values()
+        )
 
     # Find which widget was clicked
-    ui_state.previously_highlighted = ui_state.highlighted
-    ui_state.highlighted = None
-    for widget in widget_list:
-        y1 = widget.dimensions.y
-        y2 = y1 + widget.dimensions.height
-        x1 = widget.dimensions.x
-        x2 = x1 + widget.dimensions.width
+    current = ui_state.previously_highlighted = ui_state.highlighted
+
+    # Most clicks land in the widget that is already highlighted, so check that one first
+    if current is not None:
+        dimensions = current.dimensions
+        if (dimensions.y <= my <= dimensions.y + dimensions.height
+                and dimensions.x <= mx <= dimensions.x + dimensions.width):
+            return
 
+    ui_state.highlighted = None
+    for y1, y2, x1, x2, widget in widget_bboxes:
         if y1 <= my <= y2 and x1 <= mx <= x2:
             ui_state.highlighted = widget
             break
@@ -1059,6 +1177,20 @@ def handle_mouse_input(
             return
 
 
+def _quit_key_handler(log_messages: LogMessages) -> None:
+    raise StopException(log_messages)
+
+
+def _help_key_handler(_log_messages: LogMessages) -> None:
+    pass  # TODO: Help page? Even for each window?
+
+
+def _reload_key_handler(_log_messages: LogMessages) -> None:
+    # A manual reload always reads the config files again, even an edit the (mtime, size) check can't see
+    invalidate_yaml_cache()
+    raise RestartException  # Reload widgets & config
+
+
 def handle_key_input(
         ui_state: UIState,
         base_config: BaseConfig,
@@ -1074,62 +1206,103 @@ def handle_key_input(
         return
 
     if highlighted_widget is None:
-        if key == ord(base_config.quit_key):
-            raise StopException(_log_messages)
-        elif key == ord(base_config.help_key):
-            pass  # TODO: Help page? Even for each window?
-        elif key == ord(base_config.reload_key):  # Reload widgets & config
-            raise RestartException
+        if (handler := base_config.global_key_handlers.get(key)) is not None:
+            handler(_log_messages)
         return
 
     highlighted_widget.keyboard_action(highlighted_widget, key, ui_state, base_config)
 
 
+SCHEDULER_MIN_WAIT: float = 0.06667  # ~15 FPS, also how often failed updates are retried
+SCHEDULER_MAX_WAIT: float = 1.0  # Upper bound, so changes made elsewhere (e.g. last_updated reset) are noticed
+
+
+def apply_widget_update(widget: Widget, future: concurrent.futures.Future[list[str] | None]) -> None:
+    """Store the result of a finished widget update (runs on the worker thread)"""
+    if future.cancelled():
+        return
+
+    try:
+        draw_data = future.result()
+    except Exception as e:
+        error_message = str(e)
+        with widget.lock:
+            # Keep the existing object if the same error repeats, so on-change widgets don't redraw it
+            previous = widget.draw_data
+            if not (isinstance(previous, dict) and previous.get('__error__') == error_message):
+                widget.draw_data = {'__error__': error_message}
+        return
+
+    with widget.lock:
+        widget.draw_data = draw_data
+        widget.last_updated = time_module.time()
+
+
 def reload_widget_scheduler(
         config_loader: ConfigLoader,
         widget_dict: dict[str, Widget],
         stop_event: threading.Event
 ) -> None:
-    widget_list = list(widget_dict.values())
-    reloadable_widgets = [w for w in widget_list if w.updatable()]
+    # Built once, the set of updatable widgets doesn't change while the scheduler runs
+    reloadable_widgets: tuple[Widget, ...] = tuple(w for w in widget_dict.values() if w.updatable())
 
-    while not stop_event.is_set():
-        now = time_module.time()
-        # Update widgets if their interval has passed
-        for widget in reloadable_widgets:
-            if stop_event.is_set():  # Check on every iteration as well
-                break
+    # Blocking updates (HTTP requests, subprocesses, ...) run on a small pool,
+    # so one slow widget doesn't delay the others
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='twidgets-update')
+    pending: set[Widget] = set()
 
-            if widget.last_updated is None:
-                continue
+    def on_done(widget: Widget, future: concurrent.futures.Future[list[str] | None]) -> None:
+        apply_widget_update(widget, future)
+        pending.discard(widget)
 
-            # See widget.updatable(), types are safe.
-            if now - widget.last_updated >= widget.interval:  # type: ignore[operator]
-                try:
-                    widget.draw_data = widget.update(config_loader)
-                    widget.last_updated = now
-                except Exception as e:
-                    widget.draw_data = {'__error__': str(e)}
-
-        # Small sleep to avoid busy loop, tuned to a small value
-        time_module.sleep(0.06667)  # -> ~15 FPS
+    try:
+        while not stop_event.is_set():
+            now = time_module.time()
+            # Update widgets if their interval has passed
+            for widget in reloadable_widgets:
+                if stop_event.is_set():  # Check on every iteration as well
+                    break
+
+                if widget.last_updated is None or widget in pending:
+                    continue
+
+                # See widget.updatable(), types are safe.
+                if now - widget.last_updated >= widget.interval:  # type: ignore[operator]
+                    pending.add(widget)
+                    future = pool.submit(widget.update, config_loader)
+                    future.add_done_callback(lambda f, w=widget: on_done(w, f))  # type: ignore[misc]
+
+            # Sleep until the next widget is due; stop_event.wait() also returns as soon as we are stopped.
+            # A running update finishes at the earliest now, so its widget is due again no sooner
+            # than now + interval (instead of polling until it is done).
+            now = time_module.time()
+            next_due: float = min(
+                (
+                    now + w.interval if w in pending else w.last_updated + w.interval  # type: ignore[operator]
+                    for w in reloadable_widgets if w.last_updated is not None
+                ),
+                default=now + SCHEDULER_MAX_WAIT
+            )
+            stop_event.wait(timeout=min(max(next_due - now, SCHEDULER_MIN_WAIT), SCHEDULER_MAX_WAIT))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 def update_screen() -> None:
     curses.doupdate()
 
 
-def curses_wrapper(func: typing.Callable[[CursesWindowType], None]) -> None:
-    curses.wrapper(func)
+def curses_wrapper(func: typing.Callable[..., None], *args: typing.Any) -> None:
+    curses.wrapper(func, *args)
 
 
 # Constants
 
-CursesWindowType = _curses.window  # Type of stdscr
+CursesWindowType = curses.window  # Type of stdscr
 
 CursesBold = curses.A_BOLD
 CursesReverse = curses.A_REVERSE
-CursesError = _curses.error
+CursesError = curses.error
 
 
 class CursesKeys(IntEnum):
@@ -1141,4 +1314,5 @@ class CursesKeys(IntEnum):
     BACKSPACE = curses.KEY_BACKSPACE
     ESCAPE = 27
     MOUSE = curses.KEY_MOUSE
+    RESIZE = curses.KEY_RESIZE
     BUTTON1_PRESSED = curses.BUTTON1_PRESSED
@@ -1,12 +1,13 @@
 import threading
 import os
+import sys
 import types
 
 import twidgets.core.base as base
 import twidgets.widgets as widgets_pkg
 
 
-def main_curses(stdscr: base.CursesWindowType) -> None:
+def main_curses(stdscr: base.CursesWindowType, teardown_log_messages: base.LogMessages) -> None:
     # Always make relative paths work from the script’s directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
@@ -42,11 +43,14 @@ def main_curses(stdscr: base.CursesWindowType) -> None:
     # Initiate setup
     base.init_curses_setup(stdscr, base_config)
 
-    # Import all widget modules
+    # Import the enabled widget modules (disabled widgets are neither imported nor built,
+    # their config was still checked by the ConfigScanner above)
     builtin_widget_modules: dict[str, types.ModuleType] = widget_loader.load_builtin_widget_modules(
-        builtin_widget_names
+        [name for name in builtin_widget_names if config_loader.is_widget_enabled(name)]
+    )
+    custom_widget_modules: dict[str, types.ModuleType] = widget_loader.load_custom_widget_modules(
+        [name for name in custom_widget_names if config_loader.is_widget_enabled(name)]
     )
-    custom_widget_modules: dict[str, types.ModuleType] = widget_loader.load_custom_widget_modules()
 
     try:
         widget_dict = widget_loader.build_widgets(
@@ -58,10 +62,12 @@ def main_curses(stdscr: base.CursesWindowType) -> None:
     except Exception as e:
         raise base.UnknownException(log_messages, str(e))
 
-    widget_list: list[base.Widget] = list(widget_dict.values())
+    # Filtered once: disabled widgets are never drawn, and sizes / loading / init only concern enabled ones
+    widget_list: tuple[base.Widget, ...] = tuple(widget for widget in widget_dict.values() if widget.config.enabled)
 
-    min_height = max(widget.dimensions.height + widget.dimensions.y for widget in widget_list if widget.config.enabled)
-    min_width = max(widget.dimensions.width + widget.dimensions.x for widget in widget_list if widget.config.enabled)
+    # Widget dimensions are fixed until the next restart, so these are computed once
+    min_height = max(widget.dimensions.height + widget.dimensions.y for widget in widget_list)
+    min_width = max(widget.dimensions.width + widget.dimensions.x for widget in widget_list)
     base.validate_terminal_size(stdscr, min_height, min_width)
 
     base.loading_screen(widget_list, ui_state, base_config)
@@ -79,16 +85,14 @@ def main_curses(stdscr: base.CursesWindowType) -> None:
     reloader_thread.daemon = True  # don't block exit if something goes wrong
     reloader_thread.start()
 
-    while True:
-        try:
-            min_height = max(
-                widget.dimensions.height + widget.dimensions.y for widget in widget_list if widget.config.enabled)
-            min_width = max(
-                widget.dimensions.width + widget.dimensions.x for widget in widget_list if widget.config.enabled)
-            base.validate_terminal_size(stdscr, min_height, min_width)
-
+    # No catch-all inside the loop: exceptions leave the steady-state loop and are handled once below
+    try:
+        while True:
             key: int = stdscr.getch()  # Keypresses
 
+            if key == base.CursesKeys.RESIZE:  # The terminal size can only change on a resize event
+                base.validate_terminal_size(stdscr, min_height, min_width)
+
             base.handle_mouse_input(ui_state, base_config, key, log_messages, widget_dict)
 
             base.handle_key_input(ui_state, base_config, key, log_messages, widget_dict)
@@ -102,60 +106,49 @@ def main_curses(stdscr: base.CursesWindowType) -> None:
                     if stop_event.is_set():
                         break
 
-                    if not widget.updatable():
-                        widget.draw(ui_state, base_config)
-                        widget.noutrefresh()
-                        continue
-
-                    if widget.draw_data:
-                        with widget.lock:
-                            data_copy = widget.draw_data.copy()
-                        if '__error__' in data_copy:
-                            base.display_error(widget, [widget.draw_data['__error__']], ui_state, base_config)
-                        else:
-                            widget.draw(ui_state, base_config, data_copy)
-                    # else: Data still loading
+                    widget.refresh(ui_state, base_config)
                 except Exception as e:
                     base.display_error(widget, [str(e)], ui_state, base_config)
 
                 widget.noutrefresh()
             base.update_screen()
-        except (
-                base.RestartException,
-                base.ConfigScanFoundError,
-                base.ConfigFileNotFoundError,
-                base.ConfigSpecificException,
-                base.StopException,
-                base.TerminalTooSmall,
-                base.WidgetSourceFileException
-        ):
-            # Clean up threads and re-raise so outer loop stops
-            try:
-                base.cleanup_curses_setup(stop_event, reloader_thread)
-            except base.CursesError:
-                return  # Ignore; Doesn't happen on Py3.13, but does on Py3.12
-            raise  # re-raise so wrapper(main_curses) exits and outer loop stops
-        except Exception as e:
-            # Clean up threads and re-raise so outer loop stops
-            try:
-                base.cleanup_curses_setup(stop_event, reloader_thread)
-            except base.CursesError:
-                return  # Ignore; Doesn't happen on Py3.13, but does on Py3.12
-            try:
-                min_height = max(
-                    widget.dimensions.height + widget.dimensions.y for widget in widget_list if widget.config.enabled)
-                min_width = max(
-                    widget.dimensions.width + widget.dimensions.x for widget in widget_list if widget.config.enabled)
-                base.validate_terminal_size(stdscr, min_height, min_width)
-            except base.TerminalTooSmall:
-                raise  # E.g. the terminal size just changed (split windows, ...)
-            raise base.UnknownException(log_messages, str(e))
+    except (
+            base.RestartException,
+            base.ConfigScanFoundError,
+            base.ConfigFileNotFoundError,
+            base.ConfigSpecificException,
+            base.StopException,
+            base.TerminalTooSmall,
+            base.WidgetSourceFileException
+    ):
+        # Clean up threads and re-raise so outer loop stops
+        try:
+            base.cleanup_curses_setup(stop_event, reloader_thread)
+        except base.CursesError:
+            return  # Ignore; Doesn't happen on Py3.13, but does on Py3.12
+        raise  # re-raise so wrapper(main_curses) exits and outer loop stops
+    except Exception as e:
+        # Clean up threads and re-raise so outer loop stops
+        try:
+            base.cleanup_curses_setup(stop_event, reloader_thread)
+        except base.CursesError:
+            return  # Ignore; Doesn't happen on Py3.13, but does on Py3.12
+        try:
+            base.validate_terminal_size(stdscr, min_height, min_width)
+        except base.TerminalTooSmall:
+            raise  # E.g. the terminal size just changed (split windows, ...)
+        raise base.UnknownException(log_messages, str(e))
+    finally:
+        # Every way out (quit, restart, Ctrl+C, crash): widgets can still save what they hold in memory
+        base.teardown_widgets(widget_list, teardown_log_messages)
 
 
 def main_entry_point() -> None:
     while True:
+        # Filled by main_curses() on its way out, printed here once curses has shut down
+        teardown_log_messages: base.LogMessages = base.LogMessages()
         try:
-            base.curses_wrapper(main_curses)
+            base.curses_wrapper(main_curses, teardown_log_messages)
         except base.RestartException:
             # wrapper() has already cleaned up curses at this point
             continue  # Restart main
@@ -190,6 +183,8 @@ def main_entry_point() -> None:
                 f'{e.error_message}\n'
             )
             raise
+        finally:
+            teardown_log_messages.print_log_messages(heading='Errors while closing widgets:\n', file=sys.stderr)
         break  # Exit if the end of the loop is reached (User exit)
 
 
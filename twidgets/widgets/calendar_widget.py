@@ -1,5 +1,6 @@
 import datetime
 import calendar
+import functools
 from twidgets.core.base import (
     Widget,
     Config,
@@ -13,36 +14,42 @@ from twidgets.core.base import (
 )
 
 
+_CALENDAR = calendar.Calendar(firstweekday=0)  # Monday first
+_WEEKDAY_HEADER = ' '.join(('Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su'))
+# Cell text by day number, 0 is a day outside the month
+_DAY_STRINGS: tuple[str, ...] = (' ',) + tuple(f'{d:02}' for d in range(1, 32))
+
+
+@functools.lru_cache(maxsize=4)
+def _month_grid(year: int, month: int) -> tuple[tuple[int, ...], ...]:
+    """Weeks of the month as day numbers (0 outside the month), only changes when the month does"""
+    return tuple(tuple(week) for week in _CALENDAR.monthdayscalendar(year, month))
+
+
 def draw(widget: Widget, ui_state: UIState, base_config: BaseConfig) -> None:
     draw_widget(widget, ui_state, base_config)
 
-    today = datetime.date.today()
-    year, month, day = today.year, today.month, today.day
+    today = datetime.date.today()  # Per draw, the widget has to follow the date
+    day = today.day
 
     # Month header
     month_name = today.strftime('%B %Y')
     safe_addstr(widget, 1, 2, month_name)
 
     # Weekday headers
-    weekdays = ['Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su']
-    safe_addstr(widget, 2, 2, ' '.join(weekdays))
+    safe_addstr(widget, 2, 2, _WEEKDAY_HEADER)
 
     # Calendar days
-    cal = calendar.Calendar(firstweekday=0)  # Monday first
+    today_color = convert_color_number_to_curses_pair(base_config.PRIMARY_PAIR_NUMBER) | CursesBold
     row = 3
-    col = 2
-    for i, week in enumerate(cal.monthdayscalendar(year, month)):
+    for week in _month_grid(today.year, today.month):
+        col = 2
         for d in week:
-            if d == 0:
-                safe_addstr(widget, row, col, ' ')
-            elif d == day:
-                safe_addstr(
-                    widget, row, col, f'{d:02}',
-                    convert_color_number_to_curses_pair(base_config.PRIMARY_PAIR_NUMBER) | CursesBold)
+            if d == day:
+                safe_addstr(widget, row, col, _DAY_STRINGS[d], today_color)
             else:
-                safe_addstr(widget, row, col, f'{d:02}')
+                safe_addstr(widget, row, col, _DAY_STRINGS[d])
             col += 3
-        col = 2
         row += 1
 
 
@@ -15,26 +15,35 @@ from twidgets.core.base import (
 
 
 def draw(widget: Widget, ui_state: UIState, base_config: BaseConfig) -> None:
-    if not widget.config.weekday_format:
-        raise ConfigSpecificException(LogMessages([LogMessage(
-            f'Configuration for weekday_format is missing / incorrect ("{widget.name}" widget)',
-            LogLevels.ERROR.key)]))
-    if not widget.config.date_format:
-        raise ConfigSpecificException(LogMessages([LogMessage(
-            f'Configuration for date_format is missing / incorrect ("{widget.name}" widget)',
-            LogLevels.ERROR.key)]))
-    if not widget.config.time_format:
-        raise ConfigSpecificException(LogMessages([LogMessage(
-            f'Configuration for time_format is missing / incorrect ("{widget.name}" widget)',
-            LogLevels.ERROR.key)]))
+    # The text only changes once per second, so it is formatted once per second, not on every frame
+    now = time.time()
+    now_second = int(now)
+    if widget.internal_data.get('second') != now_second:
+        if not widget.config.weekday_format:
+            raise ConfigSpecificException(LogMessages([LogMessage(
+                f'Configuration for weekday_format is missing / incorrect ("{widget.name}" widget)',
+                LogLevels.ERROR.key)]))
+        if not widget.config.date_format:
+            raise ConfigSpecificException(LogMessages([LogMessage(
+                f'Configuration for date_format is missing / incorrect ("{widget.name}" widget)',
+                LogLevels.ERROR.key)]))
+        if not widget.config.time_format:
+            raise ConfigSpecificException(LogMessages([LogMessage(
+                f'Configuration for time_format is missing / incorrect ("{widget.name}" widget)',
+                LogLevels.ERROR.key)]))
+
+        local_time = time.localtime(now)
+        widget.internal_data = {
+            'second': now_second,
+            'content': [
+                time.strftime(widget.config.weekday_format, local_time),
+                time.strftime(widget.config.date_format, local_time),
+                time.strftime(widget.config.time_format, local_time),
+            ]
+        }
 
-    content = [
-        time.strftime(widget.config.weekday_format),
-        time.strftime(widget.config.date_format),
-        time.strftime(widget.config.time_format),
-    ]
     draw_widget(widget, ui_state, base_config)
-    add_widget_content(widget, content)
+    add_widget_content(widget, widget.internal_data['content'])
 
 
 def build(stdscr: CursesWindowType, config: Config) -> Widget:
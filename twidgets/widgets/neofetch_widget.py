@@ -1,9 +1,11 @@
-import datetime
+import concurrent.futures
+import time
+import functools
 import subprocess
-import psutil
 import locale
 import platform
 import os
+import re
 from twidgets.core.base import (
     Widget,
     Config,
@@ -21,146 +23,286 @@ from twidgets.core.base import (
 )
 
 
-def run_cmd(cmd: str) -> str | None:
-    result = subprocess.run(cmd, shell=True, text=True,
-                            capture_output=True)
+def run_cmd(argv: list[str]) -> str | None:
+    """Run a command directly (no shell) and return its stripped output, None if it failed or doesn't exist"""
+    try:
+        # Bytes, decoded once below (no locale lookup and no newline translation while reading)
+        result = subprocess.run(argv, capture_output=True)
+    except OSError:
+        return None
     if result.returncode == 0:
-        return result.stdout.strip()
+        return result.stdout.strip().decode('utf-8', 'replace')
     return None
 
 
-def return_macos_info() -> list[str]:
-    boot_time: datetime.datetime = datetime.datetime.fromtimestamp(psutil.boot_time())
-    uptime = datetime.datetime.now() - boot_time
-    days = uptime.days
-    hours, remainder = divmod(uptime.seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
-    uptime_string: str = f'{days} days, {hours} hours, {minutes} mins'
-
-    system_lang = locale.getlocale()[0] or 'Unknown'
-    encoding = locale.getpreferredencoding() or 'UTF-8'
-
-    user_name: str = os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown'
-    hostname: str = platform.node()
-    os_version: str = ' '.join(v for v in platform.mac_ver() if isinstance(v, str))
-    host_version: str | None = run_cmd('sysctl -n hw.model')
-    kernel: str = platform.release()
-    terminal: str | None = os.environ.get('TERM_PROGRAM')
-
-    brew_packages: str | None = run_cmd('brew list | wc -l')
-    zsh_version: str | None = run_cmd('zsh --version')
-    display_info: str | None = run_cmd('/usr/sbin/system_profiler SPDisplaysDataType | grep Resolution')
-    if not isinstance(display_info, str):
-        display_info = 'Resolution: Unknown'
-    terminal_font = run_cmd('defaults read com.apple.Terminal "Default Window Settings"')
-    cpu_info: str = (f'{run_cmd("sysctl -n machdep.cpu.brand_string")}'
-                     f' ({psutil.cpu_count(logical=False)} Cores @ {psutil.cpu_freq().max} MHz)')
-
-    gpu_info: str | None = None
+def _run_cmds(cmds: dict[str, list[str]]) -> dict[str, str | None]:
+    """run_cmd() for independent commands, concurrently (takes as long as the slowest, not the sum)"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(cmds)) as pool:
+        futures = {key: pool.submit(run_cmd, argv) for key, argv in cmds.items()}
+    return {key: future.result() for key, future in futures.items()}
+
+
+def _matching_lines(output: str | None, pattern: str, flags: int = 0) -> str | None:
+    """The lines of output matching pattern (what `| grep pattern` did), None if there are none"""
+    if output is None:
+        return None
+    regex = re.compile(pattern, flags)
+    lines: list[str] = [line for line in output.splitlines() if regex.search(line)]
+    return '\n'.join(lines).strip() or None
+
+
+def _count_lines(output: str | None) -> str | None:
+    """Number of lines in output (what `| wc -l` did)"""
+    if output is None:
+        return None
+    return str(len(output.splitlines()))
+
+
+def _read_cpuinfo_model() -> str | None:
+    """The first 'Model name' in /proc/cpuinfo (read directly, no cat / grep processes)"""
     try:
-        gpu_output: str | None = run_cmd('/usr/sbin/system_profiler SPDisplaysDataType')
-        if gpu_output is not None:
-            gpu_info = (f'{" ".join(gpu_output.split("Chipset Model: ")[1].split()[:2])}'
-                        f' ({gpu_output.split("Total Number of Cores: ")[1].split()[0]} Cores)')
-    except Exception:
+        with open('/proc/cpuinfo', encoding='utf-8', errors='replace') as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith('Model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
         pass
+    return None
+
+
+def _read_dt_model() -> str | None:
+    """The board model from the device tree, e.g. 'Raspberry Pi 4 Model B Rev 1.4'"""
+    try:
+        with open('/sys/firmware/devicetree/base/model', 'rb') as model:
+            return model.read().replace(b'\x00', b'').decode(errors='replace').strip() or None
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _boot_time() -> float:
+    """Boot time as a timestamp (doesn't change while running, so psutil reads it only once)"""
+    import psutil  # Only loaded once the widget actually updates
+    return psutil.boot_time()
+
+
+def _uptime_string() -> str:
+    uptime_seconds = int(time.time() - _boot_time())
+    days, remainder = divmod(uptime_seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
+    return f'{days} days, {hours} hours, {minutes} mins'
+
+
+def _sysctl_str(name: str) -> str | None:
+    """Read a string sysctl with sysctlbyname(3) (no sysctl subprocess), falls back to `sysctl -n`"""
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        sysctlbyname = libc.sysctlbyname
+    except (OSError, AttributeError):
+        return run_cmd(['sysctl', '-n', name])  # No sysctlbyname() in this libc
+
+    # First call for the size, second one for the value
+    size = ctypes.c_size_t(0)
+    if sysctlbyname(name.encode(), None, ctypes.byref(size), None, 0) != 0 or size.value == 0:
+        return run_cmd(['sysctl', '-n', name])
+    buffer = ctypes.create_string_buffer(size.value)
+    if sysctlbyname(name.encode(), buffer, ctypes.byref(size), None, 0) != 0:
+        return run_cmd(['sysctl', '-n', name])
+    return buffer.value.decode(errors='replace').strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _static_macos_info() -> dict[str, str | None]:
+    """Everything but the uptime (collected once, these barely change while running and need many subprocesses)"""
+    import psutil  # Only loaded once the widget actually updates
+
+    outputs = _run_cmds({
+        'brew_packages': ['brew', 'list'],
+        'zsh_version': ['zsh', '--version'],
+        'terminal_font': ['defaults', 'read', 'com.apple.Terminal', 'Default Window Settings'],
+        'displays': ['/usr/sbin/system_profiler', 'SPDisplaysDataType'],
+    })
+
+    uname = os.uname()  # One uname(2) for hostname and kernel, instead of one per platform.*() call
+    info: dict[str, str | None] = {
+        'system_lang': locale.getlocale()[0] or 'Unknown',
+        'encoding': locale.getpreferredencoding() or 'UTF-8',
+        'user_name': os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown',
+        'hostname': uname.nodename,
+        'os_version': ' '.join(v for v in platform.mac_ver() if isinstance(v, str)),
+        'host_version': _sysctl_str('hw.model'),
+        'kernel': uname.release,
+        'terminal': os.environ.get('TERM_PROGRAM'),
+        'brew_packages': _count_lines(outputs['brew_packages']) or 'Unknown',
+        'zsh_version': outputs['zsh_version'],
+        'terminal_font': outputs['terminal_font'],
+        'cpu_info': (f'{_sysctl_str("machdep.cpu.brand_string")}'
+                     f' ({psutil.cpu_count(logical=False)} Cores @ {psutil.cpu_freq().max} MHz)'),
+        'display_info': 'Resolution: Unknown',
+        'gpu_info': None,
+    }
 
-    return [
-        f'                    \'c.          {user_name}@{hostname}',
+    # system_profiler is slow, so it runs once and both the resolution and the GPU are parsed from its output
+    gpu_output: str | None = outputs['displays']
+    if gpu_output is not None:
+        resolution_lines: list[str] = [line for line in gpu_output.splitlines() if 'Resolution' in line]
+        if resolution_lines:
+            info['display_info'] = '\n'.join(resolution_lines).strip()
+
+        try:
+            info['gpu_info'] = (f'{" ".join(gpu_output.split("Chipset Model: ")[1].split()[:2])}'
+                                f' ({gpu_output.split("Total Number of Cores: ")[1].split()[0]} Cores)')
+        except Exception:
+            pass
+
+    return info
+
+
+# Index of the uptime line in _macos_lines(), the only one that changes between updates
+_MACOS_UPTIME_LINE = 5
+
+
+@functools.lru_cache(maxsize=None)
+def _macos_lines() -> tuple[str, ...]:
+    """The rendered logo and info, rendered once (the uptime line ends before its value)"""
+    info = _static_macos_info()
+
+    return (
+        f'                    \'c.          {info["user_name"]}@{info["hostname"]}',
         f'                 ,xNMM.          -------------------- ',
-        f'               .OMMMMo           OS: macOS {os_version}',
-        f'               OMMM0,            Host: {host_version}',
-        f'     .;loddo:\' loolloddol;.      Kernel: {kernel}',
-        f'   cKMMMMMMMMMMNWMMMMMMMMMM0:    Uptime: {uptime_string}',
-        f' .KMMMMMMMMMMMMMMMMMMMMMMMWd.    Packages: {brew_packages} (brew)',
-        f' XMMMMMMMMMMMMMMMMMMMMMMMX.      Shell: {zsh_version}',
-        f';MMMMMMMMMMMMMMMMMMMMMMMM:       {display_info}',
-        f':MMMMMMMMMMMMMMMMMMMMMMMM:       Language: {system_lang}',
-        f'.MMMMMMMMMMMMMMMMMMMMMMMMX.      Encoding: {encoding}',
-        f' kMMMMMMMMMMMMMMMMMMMMMMMMWd.    Terminal: {terminal}',
-        f' .XMMMMMMMMMMMMMMMMMMMMMMMMMMk   Terminal Font: {terminal_font}',
-        f'  .XMMMMMMMMMMMMMMMMMMMMMMMMK.   CPU: {cpu_info}',
-        f'    kMMMMMMMMMMMMMMMMMMMMMMd     GPU: {gpu_info}',
+        f'               .OMMMMo           OS: macOS {info["os_version"]}',
+        f'               OMMM0,            Host: {info["host_version"]}',
+        f'     .;loddo:\' loolloddol;.      Kernel: {info["kernel"]}',
+        '   cKMMMMMMMMMMNWMMMMMMMMMM0:    Uptime: ',  # + uptime, see return_macos_info()
+        f' .KMMMMMMMMMMMMMMMMMMMMMMMWd.    Packages: {info["brew_packages"]} (brew)',
+        f' XMMMMMMMMMMMMMMMMMMMMMMMX.      Shell: {info["zsh_version"]}',
+        f';MMMMMMMMMMMMMMMMMMMMMMMM:       {info["display_info"]}',
+        f':MMMMMMMMMMMMMMMMMMMMMMMM:       Language: {info["system_lang"]}',
+        f'.MMMMMMMMMMMMMMMMMMMMMMMMX.      Encoding: {info["encoding"]}',
+        f' kMMMMMMMMMMMMMMMMMMMMMMMMWd.    Terminal: {info["terminal"]}',
+        f' .XMMMMMMMMMMMMMMMMMMMMMMMMMMk   Terminal Font: {info["terminal_font"]}',
+        f'  .XMMMMMMMMMMMMMMMMMMMMMMMMK.   CPU: {info["cpu_info"]}',
+        f'    kMMMMMMMMMMMMMMMMMMMMMMd     GPU: {info["gpu_info"]}',
         f'     ;KMMMMMMMWXXWMMMMMMMk.      ',
         f'       .cooc,.    .,coo:.        '
-    ]
+    )
 
 
-def return_raspi_info() -> list[str]:
-    boot_time: datetime.datetime = datetime.datetime.fromtimestamp(psutil.boot_time())
-    uptime = datetime.datetime.now() - boot_time
-    days = uptime.days
-    hours, remainder = divmod(uptime.seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
-    uptime_string: str = f'{days} days, {hours} hours, {minutes} mins'
-
-    system_lang = locale.getlocale()[0] or 'Unknown'
-    encoding = locale.getpreferredencoding() or 'UTF-8'
-
-    user_name: str = os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown'
-    hostname: str = platform.node()
-    os_info: str = platform.platform().split('+')[0]
-    host_version: str = (run_cmd('cat /sys/firmware/devicetree/base/model') or 'Unknown Model').replace('\x00', '')
-    kernel: str = platform.release()
-    terminal: str = (
-            os.environ.get('TERM_PROGRAM')
-            or os.environ.get('TERM')
-            or os.environ.get('COLORTERM')
-            or ('SSH' if os.environ.get('SSH_TTY') else 'Unknown')
-    )
-    terminal_font: str = 'N/A'
+def return_macos_info() -> list[str]:
+    lines: list[str] = list(_macos_lines())
+    lines[_MACOS_UPTIME_LINE] += _uptime_string()
+    return lines
+
 
-    pkg_packages: str = run_cmd('dpkg --get-selections | wc -l') or 'Unknown'
+@functools.lru_cache(maxsize=None)
+def _static_raspi_info() -> dict[str, str | None]:
+    """Everything but the uptime (collected once, these barely change while running and need many subprocesses)"""
     shell_path: str = os.getenv('SHELL', 'bash')
+    has_display: bool = bool(os.environ.get('DISPLAY'))
+    outputs = _run_cmds({
+        'pkg_packages': ['dpkg', '--get-selections'],
+        'shell_version': [shell_path, '--version'],
+        # Else try using tvservice (Pi HDMI detection)
+        'display_info': ['xdpyinfo'] if has_display else ['tvservice', '-s'],
+        'vcgencmd': ['vcgencmd', 'version'],
+    })
+
+    uname = os.uname()  # One uname(2) for hostname and kernel, instead of one per platform.*() call
+    info: dict[str, str | None] = {
+        'system_lang': locale.getlocale()[0] or 'Unknown',
+        'encoding': locale.getpreferredencoding() or 'UTF-8',
+        'user_name': os.getenv('USER') or os.getenv('LOGNAME') or 'Unknown',
+        'hostname': uname.nodename,
+        'os_info': platform.platform().split('+')[0],
+        'host_version': _read_dt_model() or 'Unknown Model',
+        'kernel': uname.release,
+        'terminal': (
+                os.environ.get('TERM_PROGRAM')
+                or os.environ.get('TERM')
+                or os.environ.get('COLORTERM')
+                or ('SSH' if os.environ.get('SSH_TTY') else 'Unknown')
+        ),
+        'terminal_font': 'N/A',
+        'pkg_packages': _count_lines(outputs['pkg_packages']) or 'Unknown',
+    }
+
     try:
-        raw_shell_version: str | None = run_cmd(f'{shell_path} --version | head -n 1')
+        raw_shell_version: str | None = outputs['shell_version']
         shell_version: str = shell_path
         if raw_shell_version is not None:
-            shell_version = (raw_shell_version.split('version ')[1].split(' ')[0]
+            first_line: str = raw_shell_version.split('\n', 1)[0]
+            shell_version = (first_line.split('version ')[1].split(' ')[0]
                              or shell_path)
     except IndexError:
         shell_version = 'Unknown'
+    info['shell_version'] = shell_version
 
     cpu_info: str = 'Unknown CPU'
-    raw_cpu_info: str | None = platform.processor() or run_cmd(
-        'cat /proc/cpuinfo | grep "Model name" | head -n 1 | cut -d: -f2')
+    raw_cpu_info: str | None = platform.processor() or None
+    if not raw_cpu_info:
+        raw_cpu_info = _read_cpuinfo_model()
     if raw_cpu_info is None:
-        raw_cpu_info = run_cmd('lscpu | grep "Model name" | awk -F: "{print $2}"')
+        raw_cpu_info = _matching_lines(run_cmd(['lscpu']), 'Model name')
         if raw_cpu_info is not None:
             cpu_info = raw_cpu_info.split('Model name:')[1].strip() or 'Unknown CPU'
     else:
         cpu_info = raw_cpu_info.strip()
+    info['cpu_info'] = cpu_info
 
-    if os.environ.get('DISPLAY'):
-        display_info: str | None = (run_cmd('xdpyinfo 2>/dev/null | grep "dimensions:" | awk "{print $2}"')
-                                    or 'Display: Unknown')
+    if has_display:
+        info['display_info'] = _matching_lines(outputs['display_info'], 'dimensions:') or 'Display: Unknown'
     else:
-        # Try using tvservice (Pi HDMI detection)
-        display_info = run_cmd('tvservice -s | grep -o "[0-9]*x[0-9]*"') or 'Display: Headless'
+        resolutions: list[str] = re.findall(r'[0-9]*x[0-9]*', outputs['display_info'] or '')
+        info['display_info'] = '\n'.join(r for r in resolutions if r) or 'Display: Headless'
+
+    info['gpu_info'] = (
+            _matching_lines(outputs['vcgencmd'], 'version')
+            or _matching_lines(run_cmd(['lspci']), 'vga|3d|display', re.IGNORECASE)
+            or 'Unknown'
+    ).strip()
+
+    return info
+
+
+# Index of the uptime line in _raspi_lines(), the only one that changes between updates
+_RASPI_UPTIME_LINE = 6
+
 
-    gpu_info: str = (run_cmd('vcgencmd version | grep version') or run_cmd(
-        'lspci | grep -i "vga\\|3d\\|display"') or 'Unknown').strip()
+@functools.lru_cache(maxsize=None)
+def _raspi_lines() -> tuple[str, ...]:
+    """The rendered logo and info, rendered once (the uptime line ends before its value)"""
+    info = _static_raspi_info()
 
-    return [
+    return (
         f'',
-        f'       _,met$$$$$gg.          {user_name}@{hostname}',
+        f'       _,met$$$$$gg.          {info["user_name"]}@{info["hostname"]}',
         f'    ,g$$$$$$$$$$$$$$$P.       --------------',
-        f'  ,g$$P"     """Y$$.".        OS: {os_info}',
-        f' ,$$P\'              `$$$.     Host: {host_version}',
-        f'\',$$P       ,ggs.     `$$b:   Kernel: {kernel}',
-        f'`d$$\'     ,$P"\'   .    $$$    Uptime: {uptime_string}',
-        f' $$P      d$\'     ,    $$P    Packages: {pkg_packages} (dpkg)',
-        f' $$:      $$.   -    ,d$$\'    Shell: {shell_version}',
-        f' $$;      Y$b._   _,d$P\'      {display_info}',
-        f' Y$$.    `.`"Y$$$$P"\'         Language: {system_lang}',
-        f' `$$b      "-.__              Encoding: {encoding}',
-        f'  `Y$$                        Terminal: {terminal}',
-        f'   `Y$$.                      Terminal Font: {terminal_font}',
-        f'     `$$b.                    CPU: {cpu_info}',
-        f'       `Y$$b.                 GPU: {gpu_info}',
+        f'  ,g$$P"     """Y$$.".        OS: {info["os_info"]}',
+        f' ,$$P\'              `$$$.     Host: {info["host_version"]}',
+        f'\',$$P       ,ggs.     `$$b:   Kernel: {info["kernel"]}',
+        '`d$$\'     ,$P"\'   .    $$$    Uptime: ',  # + uptime, see return_raspi_info()
+        f' $$P      d$\'     ,    $$P    Packages: {info["pkg_packages"]} (dpkg)',
+        f' $$:      $$.   -    ,d$$\'    Shell: {info["shell_version"]}',
+        f' $$;      Y$b._   _,d$P\'      {info["display_info"]}',
+        f' Y$$.    `.`"Y$$$$P"\'         Language: {info["system_lang"]}',
+        f' `$$b      "-.__              Encoding: {info["encoding"]}',
+        f'  `Y$$                        Terminal: {info["terminal"]}',
+        f'   `Y$$.                      Terminal Font: {info["terminal_font"]}',
+        f'     `$$b.                    CPU: {info["cpu_info"]}',
+        f'       `Y$$b.                 GPU: {info["gpu_info"]}',
         f'          `"Y$b._             ',
         f'              `"""            '
-    ]
+    )
+
+
+def return_raspi_info() -> list[str]:
+    lines: list[str] = list(_raspi_lines())
+    lines[_RASPI_UPTIME_LINE] += _uptime_string()
+    return lines
 
 
 def update(_widget: Widget, _config_loader: ConfigLoader) -> list[str]:
@@ -171,31 +313,48 @@ def update(_widget: Widget, _config_loader: ConfigLoader) -> list[str]:
             f'Configuration for system_type is missing / incorrect ("{_widget.name}" widget)',
             LogLevels.ERROR.key)]))
 
+    # The only changing value is the uptime in minutes: within the same minute, the previous list is
+    # returned as is (same object, so the widget isn't redrawn either, see redraw_on_change_only())
+    uptime_minute: int = int(time.time() - _boot_time()) // 60
+    internal_data = _widget.internal_data
+    if internal_data.get('uptime_minute') == uptime_minute and 'lines' in internal_data:
+        return internal_data['lines']  # type: ignore[no-any-return]
+
     if system_type == 'macos':
-        return return_macos_info()
+        lines = return_macos_info()
     elif system_type == 'raspbian':
-        return return_raspi_info()
+        lines = return_raspi_info()
     else:
         return [
             f'Invalid system_type "{system_type}" not supported.'
         ]
 
+    internal_data['uptime_minute'] = uptime_minute
+    internal_data['lines'] = lines
+    return lines
+
 
 def draw(widget: Widget, ui_state: UIState, base_config: BaseConfig, lines: list[str]) -> None:
     draw_widget(widget, ui_state, base_config)
 
-    colors = [i for i in range(1, 18)]
+    color_attrs: tuple[int, ...] = widget.internal_data['color_attrs']
+    color_count = len(color_attrs)
 
     for i, line in enumerate(lines):
-        safe_addstr(widget, 1 + i, 2, line,
-                    convert_color_number_to_curses_pair(colors[i % len(colors)] + 6))
+        safe_addstr(widget, 1 + i, 2, line, color_attrs[i % color_count])
 
 
 def build(stdscr: CursesWindowType, config: Config) -> Widget:
-    return Widget(
+    widget = Widget(
         config.name, config.title, config, draw, config.interval, config.dimensions, stdscr,
         update_func=update,
         mouse_click_func=None,
         keyboard_func=None,
         init_func=None
     )
+    # One gradient color per line (pairs 7 to 23), looked up once instead of on every draw
+    widget.internal_data = {
+        'color_attrs': tuple(convert_color_number_to_curses_pair(color + 6) for color in range(1, 18))
+    }
+    widget.redraw_on_change_only()
+    return widget
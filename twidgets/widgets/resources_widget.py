@@ -1,5 +1,3 @@
-import psutil
-import shutil
 from twidgets.core.base import (
     Widget,
     Config,
@@ -11,18 +9,39 @@ from twidgets.core.base import (
     BaseConfig
 )
 
+# Reciprocals, so the unit conversions below are a multiplication instead of a division
+_MIB: float = 1.0 / (1024 * 1024)
+_GIB: float = 1.0 / (1024 * 1024 * 1024)
+
+# Disk usage barely moves between updates, so the statvfs() result is reused for this many seconds
+_DISK_USAGE_TTL: float = 5.0
+
 
 def update(_widget: Widget, _config_loader: ConfigLoader) -> list[str]:
+    # Imported here, so psutil is only loaded once the widget actually updates (not if it's disabled)
+    import psutil
+    import shutil
+    import time
+
+    _round = round  # Used for every value below, a local is cheaper than the builtins lookup
+
     cpu = psutil.cpu_percent()
     cpu_cores = psutil.cpu_count(logical=False)
     cpu_freq = psutil.cpu_freq()
     memory = psutil.virtual_memory()
     swap = psutil.swap_memory()
-    disk_usage = shutil.disk_usage('/')
     network = psutil.net_io_counters()
 
-    old_bytes_sent: int = _widget.internal_data.get('bytes_sent')
-    old_bytes_recv: int = _widget.internal_data.get('bytes_recv')
+    # Both counters are stored together (internal_data below), so one lookup tells if there is a previous sample
+    internal_data = _widget.internal_data
+
+    now: float = time.monotonic()
+    disk_usage = internal_data.get('disk_usage')
+    disk_checked: float = internal_data.get('disk_checked', 0.0)
+    if disk_usage is None or now - disk_checked >= _DISK_USAGE_TTL:
+        disk_usage = shutil.disk_usage('/')
+        disk_checked = now
+    old_bytes_sent: int | None = internal_data.get('bytes_sent')
 
     new_bytes_sent: int = network.bytes_sent
     new_bytes_recv: int = network.bytes_recv
@@ -30,31 +49,34 @@ def update(_widget: Widget, _config_loader: ConfigLoader) -> list[str]:
     difference_bytes_sent_mib: float = 0.0
     difference_bytes_recv_mib: float = 0.0
 
-    if _widget.config.interval is not None:
-        if old_bytes_sent is not None:
-            difference_bytes_sent_mib = round(((new_bytes_sent - old_bytes_sent) / _widget.config.interval) /
-                                              (1024 ** 2), 2)
-        if old_bytes_recv is not None:
-            difference_bytes_recv_mib = round(((new_bytes_recv - old_bytes_recv) / _widget.config.interval) /
-                                              (1024 ** 2), 2)
+    interval = _widget.config.interval
+    if interval is not None and old_bytes_sent is not None:
+        # bytes / interval -> MiB / s, as a single factor
+        rate_factor: float = _MIB / interval
+        difference_bytes_sent_mib = _round((new_bytes_sent - old_bytes_sent) * rate_factor, 2)
+        difference_bytes_recv_mib = _round((new_bytes_recv - internal_data['bytes_recv']) * rate_factor, 2)
 
     _widget.internal_data = {
         'bytes_sent': new_bytes_sent,
         'bytes_recv': new_bytes_recv,
+        'disk_usage': disk_usage,
+        'disk_checked': disk_checked,
     }
 
     # memory.used returns something else...
-    memory_used_mib: float = round((memory.total - memory.available) / (1024 ** 2), 2)
-    memory_total_mib: float = round(memory.total / (1024 ** 2), 2)
-    memory_percent: float = round(memory_used_mib * 100 / memory_total_mib, 2)
+    memory_used: int = memory.total - memory.available
+    memory_used_mib: float = _round(memory_used * _MIB, 2)
+    memory_total_mib: float = _round(memory.total * _MIB, 2)
+    # Percentages straight from the byte counts (not from the rounded MiB values)
+    memory_percent: float = _round(memory_used * 100.0 / memory.total, 2)
 
-    swap_used_mib: float = round(swap.used / (1024 ** 2), 2)
-    swap_total_mib: float = round(swap.total / (1024 ** 2), 2)
-    swap_percent: float = round(swap_used_mib * 100 / swap_total_mib, 2)
+    swap_used_mib: float = _round(swap.used * _MIB, 2)
+    swap_total_mib: float = _round(swap.total * _MIB, 2)
+    swap_percent: float = _round(swap.used * 100.0 / swap.total, 2)
 
-    disk_used_gib: float = round(disk_usage.used / (1024 ** 3), 2)
-    disk_total_gib: float = round(disk_usage.total / (1024 ** 3), 2)
-    disk_percent: float = round(disk_used_gib * 100 / disk_total_gib, 2)
+    disk_used_gib: float = _round(disk_usage.used * _GIB, 2)
+    disk_total_gib: float = _round(disk_usage.total * _GIB, 2)
+    disk_percent: float = _round(disk_usage.used * 100.0 / disk_usage.total, 2)
 
     return [
         f'CPU: {cpu:04.1f}% ({cpu_cores} Cores @ {cpu_freq.max} MHz)',
@@ -1,5 +1,8 @@
 import json
+import os
 import pathlib
+import time
+import typing
 from twidgets.core.base import (
     Widget,
     Config,
@@ -18,23 +21,92 @@ from twidgets.core.base import (
     LogLevels
 )
 
+_ENTER_KEYS: frozenset[int] = frozenset((CursesKeys.ENTER, 10, 13))
+_BACKSPACE_KEYS: frozenset[int] = frozenset((CursesKeys.BACKSPACE, 127, 8))
+
+_ELLIPSIS = '...'  # Last line when not all todos fit
+
+# Edits are saved together once no new edit came in for this many seconds (or when the widget loses focus)
+_AUTOSAVE_DELAY: float = 1.0
+
+
+def _encode_todos(todos: list[str]) -> bytes:
+    """Save file contents: one todo per line (a todo never contains a newline, see prompt_user_input())"""
+    if not todos:
+        return b''
+    return ('\n'.join(todos) + '\n').encode()
+
+
+def _decode_todos(raw: bytes) -> list[str]:
+    """Todos from the save file contents, also reads the older JSON save files"""
+    if raw[:1] in (b'[', b'{'):  # Maybe an older JSON save file (or a hand-edited line like '[ ] buy milk')
+        legacy_todos: list[str] | None = _decode_legacy_todos(raw)
+        if legacy_todos is not None:
+            return legacy_todos
+    # split('\n') instead of splitlines(), which would also split at e.g. \x1c or \u2028 inside a todo
+    # (rstrip('\r'): files edited on Windows)
+    return [line for line in (line.rstrip('\r') for line in raw.decode(errors='replace').split('\n')) if line]
+
+
+def _decode_legacy_todos(raw: bytes) -> list[str] | None:
+    """Todos from an older JSON save file (rewritten as lines on the next save), None if it isn't one"""
+    try:
+        data: typing.Any = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+    if isinstance(data, dict):
+        # {"<id>": "<todo>", ...}, in id order
+        try:
+            data = [data[key] for key in sorted(data, key=int)]
+        except ValueError:  # Not an id
+            return None
+    if not isinstance(data, list) or not all(isinstance(todo, str) for todo in data):
+        return None  # Valid JSON, but not a todo list (e.g. a hand-edited line like '[1, 2]')
+    return [todo.replace('\n', ' ') for todo in data]
+
+
+def _todo_number(todo: str) -> int:
+    """The number of a '(n) ...' todo, 0 if it has none (e.g. a hand-edited line)"""
+    if todo.startswith('('):
+        number, closing, _ = todo[1:].partition(')')
+        if closing and number.isdecimal():
+            return int(number)
+    return 0
+
+
+def _next_todo_number(todos: list[str]) -> int:
+    return max(map(_todo_number, todos), default=0) + 1
+
 
 def add_todo(widget: Widget, title: str) -> None:
-    if 'todos' in widget.draw_data:
-        widget.draw_data['todos'][widget.draw_data['todo_count']] = f'({widget.draw_data["todo_count"]}) {title}'
-        widget.draw_data['todo_count'] += 1
-    else:
-        widget.draw_data['todos'] = {1: f'(1) {title}'}
-        widget.draw_data['todo_count'] = 2
-    save_todos(widget)  # auto-save
+    todos: list[str] = widget.draw_data.setdefault('todos', [])
+    # Counted up from the highest number (computed on load), so numbers aren't reused after deleting a todo
+    number: int = widget.draw_data.get('_next_number', 1)
+    todos.append(f'({number}) {title}')
+    widget.draw_data['_next_number'] = number + 1
+    mark_dirty(widget)  # auto-save (batched, see flush_todos())
 
 
 def remove_todo(widget: Widget, line: int) -> None:
     if 'todos' in widget.draw_data:
-        keys = list(widget.draw_data['todos'].keys())
-        todo_id = keys[line]
-        widget.draw_data['todos'].pop(todo_id, None)
-    save_todos(widget)  # auto-save
+        del widget.draw_data['todos'][line]
+    mark_dirty(widget)  # auto-save (batched, see flush_todos())
+
+
+def mark_dirty(widget: Widget) -> None:
+    """Remember that the todos changed since the last save"""
+    widget.draw_data['_dirty'] = True
+    widget.draw_data['_dirty_since'] = time.monotonic()
+    widget.draw_data['_render_cache'] = None  # The visible lines changed
+
+
+def flush_todos(widget: Widget) -> None:
+    """Save the todos if they changed since the last save"""
+    if not widget.draw_data.get('_dirty'):
+        return
+    save_todos(widget)
+    widget.draw_data['_dirty'] = False
 
 
 def save_todos(widget: Widget) -> None:
@@ -42,72 +114,107 @@ def save_todos(widget: Widget) -> None:
 
     if widget.config.save_path:
         file_path = pathlib.Path(widget.config.save_path).expanduser()
-        with open(file_path, 'w') as file:
-            if 'todos' in widget.draw_data:
-                json.dump(widget.draw_data['todos'], file)
-            else:
-                json.dump({}, file)
+        # Serialized first and written at once
+        payload: bytes = _encode_todos(widget.draw_data.get('todos', []))
+        if payload == widget.draw_data.get('_saved_payload'):
+            return  # The edits cancelled out (e.g. added and deleted again), the file already has this content
+
+        # Written to a temporary file that then replaces the save file in one step,
+        # so a crash while saving leaves either the old or the new todos, never a truncated file
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        with open(tmp_path, 'wb') as file:
+            file.write(payload)
+            if widget.config.durable:
+                # Optional: make sure the todos are on disk before replacing (slower, waits for the disk)
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+        widget.draw_data['_file_signature'] = _file_signature(os.stat(file_path))
+        widget.draw_data['_saved_payload'] = payload
     else:
         raise ConfigSpecificException(LogMessages([LogMessage(
             f'Configuration for save_path is missing / incorrect ("{widget.name}" widget)',
             LogLevels.ERROR.key)]))
 
 
+def _file_signature(stat_result: os.stat_result) -> tuple[int, int]:
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def reload_if_changed(widget: Widget) -> None:
+    """Load the todos again if the save file was changed by someone else (e.g. edited by hand)"""
+    # A single stat() call, the file is only opened and parsed if it actually changed
+    try:
+        signature: tuple[int, int] | None = _file_signature(
+            os.stat(pathlib.Path(widget.config.save_path).expanduser())
+        )
+    except (OSError, TypeError):  # TypeError: save_path is missing, load_todos() reports that
+        signature = None
+    if signature != widget.draw_data.get('_file_signature'):
+        load_todos(widget)
+
+
 def load_todos(widget: Widget) -> None:
-    # If file doesn't exist, set todos = {}
+    if widget.draw_data.get('_dirty'):
+        return  # Unsaved edits are newer than the file
+
+    # If file doesn't exist, set todos = []
     if widget.config.save_path:
         try:
             file_path = pathlib.Path(widget.config.save_path).expanduser()
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-            data = {int(k): v for k, v in data.items()}
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {}
+            with open(file_path, 'rb') as file:
+                widget.draw_data['_file_signature'] = _file_signature(os.fstat(file.fileno()))
+                raw: bytes = file.read()
+            widget.draw_data['_saved_payload'] = raw
+            todos: list[str] = _decode_todos(raw)
+        except FileNotFoundError:
+            widget.draw_data['_file_signature'] = None
+            widget.draw_data['_saved_payload'] = None
+            todos = []
     else:
         raise ConfigSpecificException(LogMessages([LogMessage(
             f'Configuration for save_path is missing / incorrect ("{widget.name}" widget)',
             LogLevels.ERROR.key)]))
 
-    data = {int(k): v for k, v in data.items()}
-
-    widget.draw_data['todos'] = data
-    widget.draw_data['todo_count'] = max(data.keys(), default=0) + 1
+    widget.draw_data['todos'] = todos
+    widget.draw_data['_next_number'] = _next_todo_number(todos)
+    widget.draw_data['_render_cache'] = None
 
 
 def remove_highlighted_line(widget: Widget) -> None:
     widget.draw_data['selected_line'] = None
 
 
-def mouse_click_action(todo_widget: Widget, _mx: int, _my: int, _b_state: int, ui_state: UIState) -> None:
-    load_todos(todo_widget)
+def _compute_clicked_index(widget: Widget, my: int, todo_count: int) -> int | None:
+    """Index of the todo at screen row my, None if the click wasn't on a todo line"""
+    dimensions = widget.dimensions
+    visible_rows: int = dimensions.height - 2  # Without the borders
+
+    # Click relative to widget border
+    local_y: int = my - dimensions.y - 1  # -1 for top border
+    if not 0 <= local_y < min(todo_count, visible_rows):
+        return None
+
+    # Compute which part of todos is currently visible (centered, without going past either end)
+    abs_index: int = widget.draw_data.get('selected_line', 0) or 0
+    start: int = max(min(abs_index - visible_rows // 2, todo_count - visible_rows), 0)
+
+    # Absolute index of clicked line
+    return min(start + local_y, todo_count - 1)
 
-    todos = list(todo_widget.draw_data.get('todos', {}).values())
+
+def mouse_click_action(todo_widget: Widget, _mx: int, _my: int, _b_state: int, ui_state: UIState) -> None:
+    reload_if_changed(todo_widget)
+    todos: list[str] = todo_widget.draw_data.get('todos', [])
     if not todos or ui_state.highlighted != todo_widget:
         todo_widget.draw_data['selected_line'] = None
         return
 
-    # Click relative to widget border
-    local_y: int = _my - todo_widget.dimensions.y - 1  # -1 for top border
-    if 0 <= local_y < min(len(todos), todo_widget.dimensions.height - 2):
-        # Compute which part of todos is currently visible
-        abs_index = todo_widget.draw_data.get('selected_line', 0) or 0
-        start = max(abs_index - (todo_widget.dimensions.height - 2)//2, 0)
-        if start + (todo_widget.dimensions.height - 2) > len(todos):
-            start = max(len(todos) - (todo_widget.dimensions.height - 2), 0)
-
-        # Absolute index of clicked line
-        clicked_index = start + local_y
-        if clicked_index >= len(todos):
-            clicked_index = len(todos) - 1
-
-        todo_widget.draw_data['selected_line'] = clicked_index
-    else:
-        todo_widget.draw_data['selected_line'] = None
+    todo_widget.draw_data['selected_line'] = _compute_clicked_index(todo_widget, _my, len(todos))
 
 
 def keyboard_press_action(todo_widget: Widget, key: int, _ui_state: UIState, _base_config: BaseConfig) -> None:
-    load_todos(todo_widget)
-
+    reload_if_changed(todo_widget)
     if 'todos' not in todo_widget.draw_data:
         return
     len_todos = len(todo_widget.draw_data['todos'])
@@ -132,83 +239,95 @@ def keyboard_press_action(todo_widget: Widget, key: int, _ui_state: UIState, _ba
     todo_widget.draw_data['selected_line'] = selected
 
     # Add new to_do
-    if key in (CursesKeys.ENTER, 10, 13):
+    if key in _ENTER_KEYS:
+        todo_widget.draw_data['_drawn'] = None  # The prompt draws over the window
         new_todo = prompt_user_input(todo_widget, 'New To-Do: ')
         if new_todo.strip():
             add_todo(todo_widget, new_todo.strip())
 
     # Delete to_do
-    elif key in (CursesKeys.BACKSPACE, 127, 8):  # Backspace
+    elif key in _BACKSPACE_KEYS:  # Backspace
         if len_todos > 0:
+            todo_widget.draw_data['_drawn'] = None  # The prompt draws over the window
             confirm = prompt_user_input(todo_widget, 'Confirm deletion (y): ')
             if confirm.lower().strip() in ['y']:
                 remove_todo(todo_widget, todo_widget.draw_data['selected_line'])
 
 
 def render_todos(todos: list[str], highlighted_line: int | None, max_render: int) -> tuple[list[str], int | None]:
-    if len(todos) <= max_render:
-        return todos.copy(), highlighted_line  # everything fits, no slicing needed
+    # The returned list may be todos itself: callers only read it, they must not change it
+    todo_count = len(todos)
+    if todo_count <= max_render:
+        return todos, highlighted_line  # everything fits, no slicing (or copying) needed
 
     if highlighted_line is None:
         # No highlight → show first items
-        start = 0
-    else:
-        radius = max_render // 2
-        # Compute slice around highlighted line
-        start = max(highlighted_line - radius, 0)
-
-        # Make sure we don't go past the list
-        if start + max_render > len(todos):
-            start = max(len(todos) - max_render, 0)
+        return todos[:max_render] + [_ELLIPSIS], None
 
+    # Window centered on the highlighted line, without going past the end of the list
+    start = min(max(highlighted_line - max_render // 2, 0), todo_count - max_render)
     end = start + max_render
-    visible_todos = todos[start:end]
-
-    if highlighted_line is None:
-        rel_index = None
-    else:
-        rel_index = highlighted_line - start
+    rel_index = highlighted_line - start
 
-    # Ellipsis if needed
-    if end < len(todos):
-        visible_todos.append('...')
-        if rel_index is not None and rel_index >= max_render:
+    if end < todo_count:  # Ellipsis if needed
+        if rel_index >= max_render:
             rel_index = max_render - 1  # highlight the last visible line
-
-    return visible_todos, rel_index
+        return todos[start:end] + [_ELLIPSIS], rel_index
+    return todos[start:end], rel_index
 
 
 def init(widget: Widget, _ui_state: UIState, _base_config: BaseConfig) -> None:
+    # Loaded once here; afterwards only again if the save file changed on disk (see reload_if_changed())
     load_todos(widget)
 
 
 def draw(widget: Widget, ui_state: UIState, base_config: BaseConfig) -> None:
-    draw_widget(widget, ui_state, base_config, widget.title)
-
     if ui_state.previously_highlighted != ui_state.highlighted:  # changed
         if ui_state.previously_highlighted == widget and ui_state.highlighted != widget:
             remove_highlighted_line(widget)
+            flush_todos(widget)  # Save before e.g. quitting, which needs the widget to be unfocused first
+
+    if widget.draw_data.get('_dirty') and time.monotonic() - widget.draw_data['_dirty_since'] >= _AUTOSAVE_DELAY:
+        flush_todos(widget)
+
+    # The visible, already truncated lines only change with the todos (cache reset on changes),
+    # the selection, or the size, so they are reused between frames
+    selected_line: int | None = widget.draw_data.get('selected_line')
+    max_render: int = widget.config.max_rendering  # Defaulted once in build()
+    width: int = widget.dimensions.width
+    cache_key = (selected_line, max_render, width)
+    render_cache = widget.draw_data.get('_render_cache')
+    if render_cache is None or render_cache[0] != cache_key:
+        todos, rel_index = render_todos(widget.draw_data.get('todos', []), selected_line, max_render)
+        render_cache = widget.draw_data['_render_cache'] = (
+            cache_key, [todo[:width - 2] for todo in todos], rel_index
+        )
+    _, lines, rel_index = render_cache
+
+    # Nothing changed since the last frame (same cached lines, same highlight): the window still shows it
+    highlighted: bool = ui_state.highlighted is widget
+    drawn = widget.draw_data.get('_drawn')
+    if drawn is not None and drawn[0] is render_cache and drawn[1] == highlighted:
+        return
 
-    todos, rel_index = render_todos(
-        list(widget.draw_data.get('todos', {}).values()),
-        widget.draw_data.get('selected_line'),
-        widget.config.max_rendering if widget.config.max_rendering else 3
-    )
-
-    for i, todo in enumerate(todos):
-        if rel_index is not None and i == rel_index:
-            safe_addstr(
-                widget, 1 + i, 1, todo[:widget.dimensions.width - 2],
-                CursesReverse | convert_color_number_to_curses_pair(base_config.SECONDARY_PAIR_NUMBER))
-        else:
-            safe_addstr(widget, 1 + i, 1, todo[:widget.dimensions.width - 2])
+    draw_widget(widget, ui_state, base_config, widget.title)
+    # Looked up once per redraw instead of once per line (rel_index is None: no line is highlighted)
+    _addstr = safe_addstr
+    highlight_color: int = 0
+    if rel_index is not None:
+        highlight_color = CursesReverse | convert_color_number_to_curses_pair(base_config.SECONDARY_PAIR_NUMBER)
+    for i, line in enumerate(lines):
+        _addstr(widget, 1 + i, 1, line, highlight_color if i == rel_index else 0)
+    widget.draw_data['_drawn'] = (render_cache, highlighted)
 
 
 def build(stdscr: CursesWindowType, config: Config) -> Widget:
+    config.max_rendering = config.max_rendering or 3  # Default, resolved here instead of on every frame
     return Widget(
         config.name, config.title, config, draw, config.interval, config.dimensions, stdscr,
         update_func=None,
         mouse_click_func=mouse_click_action,
         keyboard_func=keyboard_press_action,
-        init_func=init
+        init_func=init,
+        teardown_func=flush_todos  # Edits still waiting for the autosave (see draw())
     )